@@ -9,13 +9,14 @@ import os
 # Add the meanhash module to the path
 sys.path.append('/Users/tanbajintaro/sentence_match/meanhash')
 
-from gold import SemID
-
 def generate_semid(text: str) -> str:
     """Generate SemID from text and return it as hex string"""
+    # Imported here so the usage message does not pay for loading the model stack
+    from gold import SemID
+
     semid_instance = SemID()
     semid_value = semid_instance.id24(text)
-    semid_hex = semid_instance.id_hex(text)
+    semid_hex = semid_value.to_bytes(3, 'big').hex()
 
     print(f"Text: '{text}'")
     print(f"SemID (decimal): {semid_value}")
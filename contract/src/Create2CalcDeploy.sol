@@ -71,4 +71,33 @@ contract Create2Factory {
         // 2) Immediately initialize it with the desired data
         KnowledgeContract(deployedAddress).initialize(data, decodeInfo, arbitraryInfo);
     }
+
+    /**
+     * @dev Deploys and initializes several KnowledgeContracts in one transaction.
+     *      Reverts as a whole if any salt is already taken.
+     * @param salts The salts for Create2, one per contract.
+     * @param datas Arbitrary bytes to store in each KnowledgeContract.
+     * @param decodeInfos Strings describing how to decode each entry of `datas`.
+     * @param arbitraryInfos Another user-defined string per contract.
+     * @return deployedAddresses The addresses of the newly deployed KnowledgeContracts, in input order.
+     */
+    function deployAndInitializeBatch(
+        bytes32[] calldata salts,
+        bytes[] calldata datas,
+        string[] calldata decodeInfos,
+        string[] calldata arbitraryInfos
+    ) external returns (address[] memory deployedAddresses) {
+        uint256 count = salts.length;
+        require(
+            datas.length == count && decodeInfos.length == count && arbitraryInfos.length == count,
+            "Create2: Length mismatch"
+        );
+
+        deployedAddresses = new address[](count);
+        for (uint256 i = 0; i < count; i++) {
+            address deployedAddress = deployWithCreate2(salts[i]);
+            KnowledgeContract(deployedAddress).initialize(datas[i], decodeInfos[i], arbitraryInfos[i]);
+            deployedAddresses[i] = deployedAddress;
+        }
+    }
 }
@@ -1,28 +1,269 @@
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
-from typing import Optional, Tuple, Dict, Any
-from gold import SemID
-from blockchain_integration import BlockchainConnector, SemIDBlockchainDeployer
+from typing import Optional, Tuple, Dict, Any, List, NamedTuple, TYPE_CHECKING
+from functools import partial
+from contextlib import asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from collections import OrderedDict
+import asyncio
+import multiprocessing
+import threading
+import numpy as np
+
+# モデル（gold → sentence-transformers）とweb3は重いので、実際に必要になるまでimportしない
+if TYPE_CHECKING:
+    from gold import SemID
+    from blockchain_integration import BlockchainConnector, SemIDBlockchainDeployer
 import os
 
+# マイクロバッチの設定（単体リクエストを最大 MAX_DELAY_MS 待って最大 MAX_BATCH 件にまとめる）
+MIN_BATCH = 8
+MAX_BATCH = 64
+MAX_DELAY_MS = 5
+
+# 親プロセスで保持する テキスト → SemIDResult のキャッシュ件数（ワーカーごとに持つとヒット率がワーカー数で割られる）
+SEMID_CACHE_SIZE = 100_000
+
+# SemID 計算用のワーカープロセス数（各ワーカーがモデルを 1 つずつ持つので、メモリはこの数に比例する）
+CPU_WORKERS = int(os.getenv("SEMID_CPU_WORKERS", "0")) or os.cpu_count()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # CPUバウンドなSemID計算はプロセスプール、同期的なweb3呼び出しはスレッドプールで実行する
+    # 各ワーカーは起動時に一度だけモデルをロードする（spawnでtorchのスレッド状態を引き継がない）
+    app.state.cpu_pool = ProcessPoolExecutor(
+        max_workers=CPU_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_load_model
+    )
+    app.state.io_pool = ThreadPoolExecutor(max_workers=32)
+    app.state.batcher = SemIDBatcher()
+    batcher_task = asyncio.create_task(app.state.batcher.run())
+    try:
+        yield
+    finally:
+        batcher_task.cancel()
+        app.state.cpu_pool.shutdown(wait=False, cancel_futures=True)
+        app.state.io_pool.shutdown(wait=False, cancel_futures=True)
+
 app = FastAPI(
     title="SemID + Blockchain API",
     description="テキストのSemID（Semantic ID）を生成し、ブロックチェーン上のCreate2FactoryでコントラクトをデプロイするAPI",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
-# SemIDインスタンスをグローバルに作成（モデルロードを一度だけ）
-semid_instance = SemID()
+# SemIDインスタンスはプロセスごとに一度だけ作成する（ワーカーではinitializerで事前ロード）
+_SEMID: Optional["SemID"] = None
+
+def _semid() -> "SemID":
+    """このプロセスのSemIDインスタンスを返す（初回呼び出し時にモデルをロード）"""
+    global _SEMID
+    if _SEMID is None:
+        from gold import SemID
+        _SEMID = SemID()
+    return _SEMID
+
+def _load_model():
+    """プロセスプールのinitializer：リクエスト到着前にモデルをウォームアップする"""
+    # 並列化はワーカープロセス数で行うので、各ワーカー内の torch / tokenizers は 1 スレッドに絞る
+    # （既定のままだと CPU_WORKERS × コア数のスレッドが奪い合う。モデルロード前に設定する）
+    import torch
+
+    os.environ["TOKENIZERS_PARALLELISM"] = "false"
+    torch.set_num_threads(1)
+    _semid()
+
+class SemIDResult(NamedTuple):
+    """1テキスト分のSemIDと、その派生表現（hex / bytes / parts / 32バイトsalt）"""
+    semid: int
+    semid_hex: str
+    semid_bytes: bytes
+    parts: Tuple[int, int, int]
+    salt32: bytes
+    salt_hex: str
+
+_SALT_PAD = bytes(29)
+_SALT_HEX_PAD = "00" * 29
+
+def _semid_tuple(semid: int) -> SemIDResult:
+    """24bit SemID から各表現を一度に組み立てる"""
+    semid_bytes = semid.to_bytes(3, "big")
+    semid_hex = semid_bytes.hex()
+    # The salt is the 24-bit SemID left-padded to 32 bytes, so its hex is a fixed zero prefix + semid_hex
+    return SemIDResult(
+        semid, semid_hex, semid_bytes, (semid >> 12, semid & 0xFFF, semid),
+        _SALT_PAD + semid_bytes, _SALT_HEX_PAD + semid_hex
+    )
+
+def _compute_semid(text: str) -> SemIDResult:
+    """SemIDを計算し、派生表現（salt含む）とまとめて返す（ワーカーで実行。キャッシュは親の _get_semid 側）"""
+    return _semid_tuple(_semid().id24(text))
+
+def _decode_hex(data: str) -> bytes:
+    """16進文字列（0x付き/なし）をバイト列に変換する"""
+    return bytes.fromhex(data[2:] if data[:2] in ("0x", "0X") else data)
+
+def _semid_results(semids: List[int]) -> List[SemIDResult]:
+    """
+    複数のSemIDから各表現をまとめて組み立てる。
+
+    24bit値を (B, 32) のuint8配列の末尾3バイトに一括で書き込み、
+    bytes/hexは配列全体を一度だけ変換してから32バイトごとに切り出す。
+    """
+    values = np.asarray(semids, dtype=np.uint32)
+    salts = np.zeros((len(values), 32), dtype=np.uint8)
+    salts[:, 29:] = (values[:, None] >> np.array([16, 8, 0], dtype=np.uint32)) & 0xFF
+
+    salt_raw = salts.tobytes()
+    salt_hex = salt_raw.hex()
+    results = []
+    for i, semid in enumerate(semids):
+        salt32 = salt_raw[32 * i:32 * (i + 1)]
+        semid_hex = salt_hex[64 * i + 58:64 * (i + 1)]
+        results.append(SemIDResult(
+            semid, semid_hex, salt32[29:], (semid >> 12, semid & 0xFFF, semid),
+            salt32, salt_hex[64 * i:64 * (i + 1)]
+        ))
+    return results
+
+def _compute_semid_batch(texts: List[str]) -> List[SemIDResult]:
+    """複数テキストのSemIDを1回のプール呼び出しで計算する（同一テキストは1度だけ推論、値は単体計算と同一）"""
+    unique = list(dict.fromkeys(texts))
+    results = dict(zip(unique, _semid_results(_semid().id24_batch(unique))))
+    return [results[text] for text in texts]
+
+async def _run_cpu(func, *args):
+    """CPUバウンドな処理をプロセスプールで実行する（イベントループをブロックしない）"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(app.state.cpu_pool, func, *args)
+
+async def _run_io(func, *args, **kwargs):
+    """ブロッキングI/O（web3のRPC呼び出しなど）をスレッドプールで実行する"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(app.state.io_pool, partial(func, *args, **kwargs))
+
+# 親プロセスの LRU（イベントループのスレッドからしか触らないのでロック不要）
+_semid_cache: "OrderedDict[str, SemIDResult]" = OrderedDict()
+
+def _cached_semid(text: str) -> Optional[SemIDResult]:
+    result = _semid_cache.get(text)
+    if result is not None:
+        _semid_cache.move_to_end(text)
+    return result
+
+def _remember_semid(text: str, result: SemIDResult):
+    _semid_cache[text] = result
+    _semid_cache.move_to_end(text)
+    if len(_semid_cache) > SEMID_CACHE_SIZE:
+        _semid_cache.popitem(last=False)
+
+async def _get_semid(text: str) -> SemIDResult:
+    """キャッシュになければプロセスプールで計算する"""
+    result = _cached_semid(text)
+    if result is None:
+        result = await _run_cpu(_compute_semid, text)
+        _remember_semid(text, result)
+    return result
+
+async def _get_semid_batch(texts: List[str]) -> List[SemIDResult]:
+    """キャッシュにないテキストだけを1回のプール呼び出しでまとめて計算する"""
+    results = {}
+    for text in texts:
+        result = _cached_semid(text)
+        if result is not None:
+            results[text] = result
+    missing = list(dict.fromkeys(text for text in texts if text not in results))
+    if missing:
+        for text, result in zip(missing, await _run_cpu(_compute_semid_batch, missing)):
+            results[text] = result
+            _remember_semid(text, result)
+    return [results[text] for text in texts]
+
+class SemIDBatcher:
+    """
+    同時に届いた単体リクエストのテキストをまとめ、1回のプール呼び出しで処理するコアレッサ。
+
+    - プールが空いていれば待たずに即時実行（低負荷時のレイテンシを優先）
+    - 処理中のバッチがあれば最大 MAX_DELAY_MS だけ後続を待って同じバッチに載せる
+    - バックログが続く間はバッチサイズを MAX_BATCH まで倍増し、空いてくれば MIN_BATCH まで縮める
+    """
+
+    def __init__(self):
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.batch_size = MIN_BATCH
+        self._inflight = 0
+        self._tasks = set()
+
+    async def submit(self, text: str) -> SemIDResult:
+        result = _cached_semid(text)
+        if result is not None:
+            return result
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((text, future))
+        return await future
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + MAX_DELAY_MS / 1000
+            while len(batch) < self.batch_size:
+                if not self.queue.empty():
+                    batch.append(self.queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if not self._inflight or timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            if len(batch) >= self.batch_size and not self.queue.empty():
+                self.batch_size = min(self.batch_size * 2, MAX_BATCH)
+            elif len(batch) < self.batch_size // 2:
+                self.batch_size = max(self.batch_size // 2, MIN_BATCH)
+
+            self._inflight += 1
+            task = asyncio.create_task(self._flush(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _flush(self, batch):
+        try:
+            results = await _run_cpu(_compute_semid_batch, [text for text, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for (text, future), result in zip(batch, results):
+                _remember_semid(text, result)
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            self._inflight -= 1
 
 # ブロックチェーンコネクタ（環境変数から設定）
-blockchain_connector: Optional[BlockchainConnector] = None
-deployer: Optional[SemIDBlockchainDeployer] = None
+blockchain_connector: Optional["BlockchainConnector"] = None
+deployer: Optional["SemIDBlockchainDeployer"] = None
+# I/O スレッドプールからの同時の初回呼び出しでコネクタ（nonce 管理を持つ）が二重に作られないよう、生成はロック内で 1 回だけ行う
+_factory_lock = threading.RLock()
 
-def get_blockchain_connector() -> BlockchainConnector:
+def get_blockchain_connector() -> "BlockchainConnector":
     """Get or create blockchain connector from environment variables"""
     global blockchain_connector
 
-    if blockchain_connector is None:
+    if blockchain_connector is not None:
+        return blockchain_connector
+
+    with _factory_lock:
+        if blockchain_connector is not None:
+            return blockchain_connector
+
+        from blockchain_integration import BlockchainConnector
+
         rpc_url = os.getenv("BLOCKCHAIN_RPC_URL")
         private_key = os.getenv("BLOCKCHAIN_PRIVATE_KEY")
         factory_address = os.getenv("CREATE2_FACTORY_ADDRESS")
@@ -42,21 +283,31 @@ def get_blockchain_connector() -> BlockchainConnector:
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to connect to blockchain: {e}")
 
-    return blockchain_connector
+        return blockchain_connector
 
-def get_deployer() -> SemIDBlockchainDeployer:
+def get_deployer() -> "SemIDBlockchainDeployer":
     """Get or create SemID blockchain deployer"""
     global deployer
 
-    if deployer is None:
-        connector = get_blockchain_connector()
-        deployer = SemIDBlockchainDeployer(semid_instance, connector)
+    if deployer is not None:
+        return deployer
+
+    with _factory_lock:
+        if deployer is None:
+            from blockchain_integration import SemIDBlockchainDeployer
+
+            # SemID は各エンドポイントが _run_cpu で計算して salt ごと渡すので、親プロセスにはモデルを持たせない
+            connector = get_blockchain_connector()
+            deployer = SemIDBlockchainDeployer(None, connector)
 
-    return deployer
+        return deployer
 
 class TextInput(BaseModel):
     text: str
 
+class BatchInput(BaseModel):
+    texts: List[str]
+
 class SemIDResponse(BaseModel):
     text: str
     semid: int
@@ -108,20 +359,41 @@ async def get_semid(input_data: TextInput):
     - **text**: 入力テキスト
     """
     try:
-        semid = semid_instance.id24(input_data.text)
-        semid_hex = semid_instance.id_hex(input_data.text)
-        semid_bytes = semid_instance.id_bytes(input_data.text).hex()
+        result = await app.state.batcher.submit(input_data.text)
 
         return SemIDResponse(
             text=input_data.text,
-            semid=semid,
-            semid_hex=semid_hex,
-            semid_bytes=semid_bytes
+            semid=result.semid,
+            semid_hex=result.semid_hex,
+            semid_bytes=result.semid_hex
         )
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/semid/batch", response_model=List[SemIDResponse])
+async def get_semid_batch(input_data: BatchInput):
+    """
+    複数テキストのSemIDをまとめて生成します（値は単体の /semid と同一）。
+
+    - **texts**: 入力テキストのリスト
+    """
+    try:
+        results = await _get_semid_batch(input_data.texts)
+
+        return [
+            SemIDResponse(
+                text=text,
+                semid=result.semid,
+                semid_hex=result.semid_hex,
+                semid_bytes=result.semid_hex
+            )
+            for text, result in zip(input_data.texts, results)
+        ]
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.post("/semid/hex", response_model=SemIDHexResponse)
 async def get_semid_hex(input_data: TextInput):
     """
@@ -130,11 +402,11 @@ async def get_semid_hex(input_data: TextInput):
     - **text**: 入力テキスト
     """
     try:
-        semid_hex = semid_instance.id_hex(input_data.text)
+        result = await _get_semid(input_data.text)
 
         return SemIDHexResponse(
             text=input_data.text,
-            semid_hex=semid_hex
+            semid_hex=result.semid_hex
         )
 
     except Exception as e:
@@ -148,11 +420,11 @@ async def get_semid_bytes(input_data: TextInput):
     - **text**: 入力テキスト
     """
     try:
-        semid_bytes = semid_instance.id_bytes(input_data.text).hex()
+        result = await _get_semid(input_data.text)
 
         return SemIDBytesResponse(
             text=input_data.text,
-            semid_bytes=semid_bytes
+            semid_bytes=result.semid_hex
         )
 
     except Exception as e:
@@ -166,7 +438,7 @@ async def get_semid_parts(input_data: TextInput):
     - **text**: 入力テキスト
     """
     try:
-        head0, head1, combined = semid_instance.id_parts(input_data.text)
+        head0, head1, combined = (await _get_semid(input_data.text)).parts
 
         return SemIDPartsResponse(
             text=input_data.text,
@@ -195,21 +467,26 @@ async def configure_blockchain(config: BlockchainConfig):
     - **factory_address**: Create2Factoryコントラクトアドレス（オプション）
     """
     global blockchain_connector, deployer
+    from blockchain_integration import BlockchainConnector, SemIDBlockchainDeployer
 
     try:
-        blockchain_connector = BlockchainConnector(
+        connector = await _run_io(
+            BlockchainConnector,
             rpc_url=config.rpc_url,
             private_key=config.private_key,
             factory_address=config.factory_address
         )
 
-        deployer = SemIDBlockchainDeployer(semid_instance, blockchain_connector)
+        # 取得中の get_deployer と混ざらないよう、コネクタとデプロイヤはロック内でまとめて差し替える
+        with _factory_lock:
+            blockchain_connector = connector
+            deployer = SemIDBlockchainDeployer(None, connector)
 
         response = {"status": "configured", "rpc_url": config.rpc_url}
         if config.factory_address:
             response["factory_address"] = config.factory_address
         if config.private_key:
-            response["account"] = blockchain_connector.account.address if blockchain_connector.account else None
+            response["account"] = connector.account.address if connector.account else None
 
         return response
 
@@ -228,13 +505,17 @@ async def deploy_contract(deploy_request: DeployRequest):
     - **gas_limit**: ガスリミット（オプション）
     """
     try:
-        deployer_instance = get_deployer()
+        deployer_instance = await _run_io(get_deployer)
+        semid = await _get_semid(deploy_request.text)
 
         # Convert hex data to bytes if provided
-        data_bytes = bytes.fromhex(deploy_request.data) if deploy_request.data else b""
+        data_bytes = _decode_hex(deploy_request.data) if deploy_request.data else b""
 
-        result = deployer_instance.deploy_from_text(
+        result = await _run_io(
+            deployer_instance.deploy_from_semid,
             text=deploy_request.text,
+            semid_value=semid.semid,
+            salt=semid.salt32,
             data=data_bytes,
             decode_info=deploy_request.decode_info,
             arbitrary_info=deploy_request.arbitrary_info,
@@ -246,31 +527,39 @@ async def deploy_contract(deploy_request: DeployRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Deployment failed: {e}")
 
+def _collect_blockchain_status() -> Dict[str, Any]:
+    """ブロックチェーン接続のステータスを同期的に収集する（スレッドプールで実行）"""
+    connector = get_blockchain_connector()
+
+    # 最新ブロック番号を毎回取得して疎通確認とする（ノードに届かなければ例外になり connected=False）
+    # chain_id は接続ごとに 1 回、残高は数秒キャッシュ（いずれも同じ 1 回のバッチ RPC）
+    chain_id, balance_wei, block_number = connector.get_chain_state()
+
+    status = {
+        "connected": block_number is not None,
+        "chain_id": chain_id,
+        "block_number": block_number,
+        "factory_configured": connector.factory_address is not None,
+        "account_configured": connector.account is not None,
+    }
+
+    if connector.account:
+        status["account_address"] = connector.account.address
+        # wei → ether はDecimalを経由せず整数の真の除算で求める（JSONではどちらもfloatになる）
+        status["account_balance"] = balance_wei / 10**18
+
+    if connector.factory_address:
+        status["factory_address"] = connector.factory_address
+
+    return status
+
 @app.get("/blockchain/status")
 async def blockchain_status():
     """
     ブロックチェーン接続のステータスを取得します。
     """
     try:
-        connector = get_blockchain_connector()
-
-        status = {
-            "connected": connector.w3.is_connected(),
-            "chain_id": connector.w3.eth.chain_id,
-            "factory_configured": connector.factory_address is not None,
-            "account_configured": connector.account is not None,
-        }
-
-        if connector.account:
-            status["account_address"] = connector.account.address
-            status["account_balance"] = connector.w3.from_wei(
-                connector.w3.eth.get_balance(connector.account.address), 'ether'
-            )
-
-        if connector.factory_address:
-            status["factory_address"] = connector.factory_address
-
-        return status
+        return await _run_io(_collect_blockchain_status)
 
     except Exception as e:
         return {
@@ -286,8 +575,8 @@ async def get_contract_info(address: str):
     - **address**: コントラクトアドレス
     """
     try:
-        connector = get_blockchain_connector()
-        contract_info = connector.get_contract_info(address)
+        connector = await _run_io(get_blockchain_connector)
+        contract_info = await _run_io(connector.get_contract_info, address)
         return contract_info
 
     except Exception as e:
@@ -301,20 +590,19 @@ async def predict_address(text: str):
     - **text**: SemID生成用の入力テキスト
     """
     try:
-        connector = get_blockchain_connector()
+        connector = await _run_io(get_blockchain_connector)
 
-        # Generate SemID and convert to 32-byte salt
-        semid_value = semid_instance.id24(text)
-        salt = semid_value.to_bytes(32, 'big')
+        # Generate SemID (the 32-byte salt comes precomputed, cached in this process)
+        semid = await _get_semid(text)
 
-        predicted_address = connector.compute_address(salt)
-        is_deployed = connector.is_contract_deployed(predicted_address)
+        predicted_address = await _run_io(connector.compute_address, semid.salt32)
+        is_deployed = await _run_io(connector.is_contract_deployed, predicted_address)
 
         return {
             "text": text,
-            "semid": semid_value,
-            "semid_hex": semid_instance.id_hex(text),
-            "salt": salt.hex(),
+            "semid": semid.semid,
+            "semid_hex": semid.semid_hex,
+            "salt": semid.salt_hex,
             "predicted_address": predicted_address,
             "is_deployed": is_deployed
         }
@@ -8,10 +8,19 @@ This module provides functionality to:
 """
 
 import os
-from typing import Optional, Dict, Any, Tuple
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from web3 import Web3
 from web3.middleware import ExtraDataToPOAMiddleware
+from eth_utils import event_abi_to_log_topic, keccak, to_checksum_address
 
+from Crypto.Hash import keccak as _keccak_c
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
 import json
@@ -44,6 +53,18 @@ CREATE2_FACTORY_ABI = [
         "stateMutability": "nonpayable",
         "type": "function"
     },
+    {
+        "inputs": [
+            {"internalType": "bytes32[]", "name": "salts", "type": "bytes32[]"},
+            {"internalType": "bytes[]", "name": "datas", "type": "bytes[]"},
+            {"internalType": "string[]", "name": "decodeInfos", "type": "string[]"},
+            {"internalType": "string[]", "name": "arbitraryInfos", "type": "string[]"}
+        ],
+        "name": "deployAndInitializeBatch",
+        "outputs": [{"internalType": "address[]", "name": "deployedAddresses", "type": "address[]"}],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    },
     {
         "anonymous": False,
         "inputs": [
@@ -55,6 +76,48 @@ CREATE2_FACTORY_ABI = [
     }
 ]
 
+# keccak256(type(KnowledgeContract).creationCode) for the build deployed behind the
+# Sepolia Create2Factory (0x35B586834b11dCa235B1007Faa312AA523aB6802)
+KNOWLEDGE_CONTRACT_INIT_CODE_HASH = bytes.fromhex(
+    "e7dbd33ec199c4d23ecaf4180e1dd775a23d2c3605ac597559563796046cca92"
+)
+
+# Gas price is reused for roughly one Ethereum block before being refreshed
+GAS_PRICE_TTL = 12  # seconds
+
+# Account balance reported by get_chain_state is reused for this long
+BALANCE_TTL = 2  # seconds
+
+# Keep-alive connection pool shared by every RPC of a connector
+RPC_POOL_CONNECTIONS = 32
+RPC_POOL_MAXSIZE = 128
+RPC_TIMEOUT = 10  # seconds
+
+# Responses web3 may answer from its own request cache: they never change for a given endpoint
+# (the default set also has block/transaction lookups, which can be pending or reorged)
+RPC_CACHEABLE_REQUESTS = {"eth_chainId", "net_version", "web3_clientVersion"}
+
+# Addresses without code are re-checked after this long; addresses with code stay cached
+CODE_CHECK_TTL = 5  # seconds
+CODE_CHECK_CACHE_SIZE = 100_000
+
+# Contracts read per Multicall3 eth_call (each one adds three view calls)
+MULTICALL_BATCH_ADDRESSES = 200
+
+# eth_getCode requests sent per JSON-RPC batch (providers commonly cap batches at 1000)
+RPC_BATCH_SIZE = 500
+
+# Contracts per deployAndInitializeBatch transaction; with the default 2M gas per
+# contract this stays under the 2^24 per-transaction gas cap (EIP-7825)
+BULK_DEPLOY_SIZE = 8
+DEFAULT_DEPLOY_GAS = 2000000
+
+# SemID salts are the 24-bit SemID left-padded to 32 bytes, so their hex is this prefix + semid_hex
+SALT_HEX_PAD = "00" * 29
+
+# Salts whose KnowledgeContract is known to be deployed and initialized
+DEPLOYED_STATE_CACHE_SIZE = 10_000
+
 # KnowledgeContract ABI (for verification)
 KNOWLEDGE_CONTRACT_ABI = [
     {
@@ -96,13 +159,93 @@ KNOWLEDGE_CONTRACT_ABI = [
     }
 ]
 
+# Multicall3 lives at the same address on Ethereum, Sepolia and most EVM chains
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]"
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]"
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function"
+    }
+]
+
+# (result key, calldata, return type) for each KnowledgeContract view function
+KNOWLEDGE_CONTRACT_VIEWS = [
+    ("data", keccak(text="getData()")[:4], "bytes"),
+    ("decode_info", keccak(text="getDecodeInfo()")[:4], "string"),
+    ("arbitrary_info", keccak(text="getArbitraryInfo()")[:4], "string"),
+]
+
+# Factory calldata is assembled from these selectors directly instead of via ContractFunction
+DEPLOY_AND_INITIALIZE_SELECTOR = keccak(text="deployAndInitialize(bytes32,bytes,string,string)")[:4]
+DEPLOY_AND_INITIALIZE_ARGS = ["bytes32", "bytes", "string", "string"]
+DEPLOY_WITH_CREATE2_SELECTOR = keccak(text="deployWithCreate2(bytes32)")[:4]
+DEPLOY_AND_INITIALIZE_BATCH_SELECTOR = keccak(text="deployAndInitializeBatch(bytes32[],bytes[],string[],string[])")[:4]
+DEPLOY_AND_INITIALIZE_BATCH_ARGS = ["bytes32[]", "bytes[]", "string[]", "string[]"]
+
+def _keccak256(data: bytes) -> bytes:
+    """keccak256 straight from pycryptodome's C implementation (skips eth_utils' input dispatch)"""
+    return _keccak_c.new(data=data, digest_bits=256).digest()
+
+@lru_cache(maxsize=4096)
+def _checksum_lower(address: str) -> str:
+    return to_checksum_address(address)
+
+def _checksum(address: str) -> str:
+    """Memoized to_checksum_address (each conversion is a keccak over the hex address)"""
+    return _checksum_lower(address.lower())
+
+@lru_cache(maxsize=None)
+def _rpc_session() -> requests.Session:
+    """Process-wide requests session with a sized keep-alive pool and connect retries
+
+    Every connector shares it by default, so a reconfigured connector reuses the
+    warm TCP/TLS connections instead of handshaking again.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=RPC_POOL_CONNECTIONS,
+        pool_maxsize=RPC_POOL_MAXSIZE,
+        max_retries=Retry(total=3, backoff_factor=0.1)
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 class BlockchainConnector:
     """Blockchain connector for interacting with Create2Factory"""
 
     def __init__(self,
                  rpc_url: str,
                  private_key: Optional[str] = None,
-                 factory_address: Optional[str] = None):
+                 factory_address: Optional[str] = None,
+                 init_code_hash: Optional[bytes] = KNOWLEDGE_CONTRACT_INIT_CODE_HASH,
+                 multicall_address: Optional[str] = MULTICALL3_ADDRESS,
+                 session: Optional[requests.Session] = None):
         """
         Initialize blockchain connector
 
@@ -110,8 +253,21 @@ class BlockchainConnector:
             rpc_url: RPC endpoint URL (e.g., "https://sepolia.infura.io/v3/YOUR_KEY")
             private_key: Private key for transaction signing (optional)
             factory_address: Create2Factory contract address (optional)
+            init_code_hash: keccak256 of the KnowledgeContract creation code, used to
+                compute CREATE2 addresses locally (None asks the factory over RPC)
+            multicall_address: Multicall3 address used to batch contract reads (ignored
+                when there is no code there; None or missing Multicall3 sends the plain
+                view eth_calls as JSON-RPC batches)
+            session: requests session for the RPC endpoint (defaults to the shared
+                keep-alive pool)
         """
-        self.w3 = Web3(Web3.HTTPProvider(rpc_url))
+        self.w3 = Web3(Web3.HTTPProvider(
+            rpc_url,
+            session=session or _rpc_session(),
+            request_kwargs={"timeout": RPC_TIMEOUT},
+            cache_allowed_requests=True,
+            cacheable_requests=RPC_CACHEABLE_REQUESTS
+        ))
 
         # Add PoA middleware for networks like Polygon, BSC
         self.w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
@@ -125,6 +281,28 @@ class BlockchainConnector:
 
         self.factory_address = factory_address
         self.factory_contract = None
+        self.init_code_hash = init_code_hash
+        self._configured_init_code_hash = init_code_hash
+
+        # Fresh devnets and private chains often lack Multicall3; view reads then go
+        # out as batched plain eth_calls instead (see _call_views)
+        self.multicall_contract = None
+        if multicall_address and len(self.w3.eth.get_code(_checksum(multicall_address))) > 0:
+            self.multicall_contract = self.w3.eth.contract(
+                address=_checksum(multicall_address),
+                abi=MULTICALL3_ABI
+            )
+
+        # Transaction parameter caches (see _next_tx_params)
+        self._chain_id: Optional[int] = None
+        self._gas_price: Optional[Tuple[int, float]] = None  # (value, fetched_at)
+        self._balance: Optional[Tuple[int, float]] = None  # (wei, fetched_at)
+        self._next_nonce: Optional[int] = None
+        self._tx_lock = threading.Lock()
+
+        # eth_getCode results (see _cached_code_flag)
+        self._has_code: set = set()
+        self._no_code: Dict[str, float] = {}  # address -> checked_at
 
         if factory_address:
             self._setup_factory_contract()
@@ -134,11 +312,50 @@ class BlockchainConnector:
         if not self.factory_address:
             raise ValueError("Factory address not provided")
 
-        checksum_address = self.w3.to_checksum_address(self.factory_address)
+        checksum_address = _checksum(self.factory_address)
         self.factory_contract = self.w3.eth.contract(
             address=checksum_address,
             abi=CREATE2_FACTORY_ABI
         )
+        self._factory_bytes = bytes.fromhex(checksum_address[2:])
+
+        # The configured init code hash is only used once the factory has confirmed it; a
+        # factory serving a different KnowledgeContract build is asked for every address
+        # over RPC instead
+        self.init_code_hash = None
+        self._unverified_init_code_hash = self._configured_init_code_hash
+        self._verify_init_code_hash()
+
+        # topic0 of the Deployed event, used to skip unrelated receipt logs before decoding
+        deployed_abi = next(item for item in CREATE2_FACTORY_ABI if item.get("name") == "Deployed")
+        self._deployed_topic = event_abi_to_log_topic(deployed_abi)
+        self._deployed_event = self.factory_contract.events.Deployed()
+
+    def _verify_init_code_hash(self):
+        """
+        Compare the local CREATE2 computation with the factory's for a probe salt
+
+        A match enables local address computation; a mismatch drops the configured
+        hash for good. If the probe fails (node unreachable, not a Create2Factory)
+        nothing is assumed: addresses keep coming from the factory over RPC and the
+        probe is retried on the next compute_address call.
+        """
+        init_code_hash = self._unverified_init_code_hash
+        if init_code_hash is None:
+            return
+        probe = bytes(32)
+        local = to_checksum_address(
+            _keccak256(b"\xff" + self._factory_bytes + probe + init_code_hash)[12:]
+        )
+        try:
+            remote = self.factory_contract.functions.computeCreate2Address(probe).call()
+        except Exception:
+            return
+        self._unverified_init_code_hash = None
+        if remote == local:
+            # CREATE2 preimage with a zero salt; compute_semid_address fills in the low salt bytes
+            self._create2_template = b"\xff" + self._factory_bytes + bytes(32) + init_code_hash
+            self.init_code_hash = init_code_hash
 
     def set_factory_address(self, address: str):
         """Set the Create2Factory contract address"""
@@ -161,12 +378,121 @@ class BlockchainConnector:
         if len(salt) != 32:
             raise ValueError("Salt must be exactly 32 bytes")
 
+        if self.init_code_hash is None:
+            self._verify_init_code_hash()
+
+        if self.init_code_hash is not None:
+            # CREATE2: keccak256(0xff ++ factory ++ salt ++ keccak256(init_code))[12:]
+            digest = _keccak256(b"\xff" + self._factory_bytes + salt + self.init_code_hash)
+            return to_checksum_address(digest[12:])
+
         try:
             address = self.factory_contract.functions.computeCreate2Address(salt).call()
             return address
         except Exception as e:
             raise RuntimeError(f"Failed to compute address: {e}")
 
+    def compute_semid_address(self, semid_value: int) -> str:
+        """
+        Compute the KnowledgeContract address for a 24-bit SemID used as the salt
+
+        Same result as compute_address(semid_value.to_bytes(32, 'big')), but the
+        SemID is written into a preallocated preimage instead of building a salt.
+
+        Args:
+            semid_value: 24-bit SemID
+
+        Returns:
+            Predicted contract address
+        """
+        if not self.factory_contract:
+            raise ValueError("Factory contract not initialized")
+
+        if self.init_code_hash is None or not 0 <= semid_value < 1 << 24:
+            return self.compute_address(semid_value.to_bytes(32, 'big'))
+
+        # 0xff (1) ++ factory (20) ++ salt (32): the SemID is the last 3 salt bytes
+        preimage = bytearray(self._create2_template)
+        preimage[50:53] = semid_value.to_bytes(3, 'big')
+        return to_checksum_address(_keccak256(preimage)[12:])
+
+    def get_chain_id(self) -> int:
+        """Return the chain id (fetched once per connector)"""
+        if self._chain_id is None:
+            self._chain_id = self.w3.eth.chain_id
+        return self._chain_id
+
+    def get_chain_state(self) -> Tuple[int, Optional[int], int]:
+        """
+        Return the chain id, the account balance and the latest block number
+
+        The block number is always fetched, so every call is a real round trip to
+        the node and raises when it is unreachable (status endpoints use it as the
+        liveness check). The chain id is fetched once per connector and the
+        balance is reused for BALANCE_TTL seconds (and dropped after each of our
+        own transactions). Everything goes out in a single JSON-RPC batch request.
+
+        Returns:
+            (chain_id, balance in wei, block number), balance is None when no
+            account is configured
+        """
+        now = time.monotonic()
+        refresh_balance = self.account is not None and (
+            self._balance is None or now - self._balance[1] > BALANCE_TTL
+        )
+        fetch_chain_id = self._chain_id is None
+
+        with self.w3.batch_requests() as batch:
+            batch.add(self.w3.eth.block_number)
+            if fetch_chain_id:
+                batch.add(self.w3.eth.chain_id)
+            if refresh_balance:
+                batch.add(self.w3.eth.get_balance(self.account.address))
+            results = list(batch.execute())
+
+        block_number = results.pop(0)
+        if fetch_chain_id:
+            self._chain_id = results.pop(0)
+        if refresh_balance:
+            self._balance = (results[0], now)
+
+        balance = self._balance[0] if self.account else None
+        return self._chain_id, balance, block_number
+
+    def _next_tx_params(self) -> Dict[str, int]:
+        """
+        Return chainId, gasPrice and nonce for the next transaction
+
+        The chain id is fetched once, the gas price is cached for GAS_PRICE_TTL
+        seconds and the nonce is tracked locally after the first lookup. Whatever
+        needs refreshing is fetched in a single JSON-RPC batch request.
+        Must be called with self._tx_lock held.
+        """
+        now = time.monotonic()
+        refresh_gas = self._gas_price is None or now - self._gas_price[1] > GAS_PRICE_TTL
+
+        if self._chain_id is None or refresh_gas or self._next_nonce is None:
+            with self.w3.batch_requests() as batch:
+                batch.add(self.w3.eth.chain_id)
+                batch.add(self.w3.eth.gas_price)
+                batch.add(self.w3.eth.get_transaction_count(self.account.address, 'pending'))
+                chain_id, gas_price, nonce = batch.execute()
+
+            self._chain_id = chain_id
+            self._gas_price = (gas_price, now)
+            if self._next_nonce is None:
+                self._next_nonce = nonce
+
+        return {
+            'chainId': self._chain_id,
+            'gasPrice': self._gas_price[0],
+            'nonce': self._next_nonce,
+        }
+
+    def _reset_nonce(self):
+        """Drop the locally tracked nonce so the next transaction resyncs from chain"""
+        self._next_nonce = None
+
     def deploy_contract(self,
                        salt: bytes,
                        data: bytes = b"",
@@ -186,63 +512,254 @@ class BlockchainConnector:
         Returns:
             Tuple of (transaction_hash, deployed_address)
         """
-        if not self.factory_contract or not self.account:
-            raise ValueError("Factory contract and account must be initialized")
+        tx_hash = self.send_deploy_transaction(salt, data, decode_info, arbitrary_info, gas_limit)
+        return self.wait_for_deployment(tx_hash, salt)
+
+    def send_deploy_transaction(self,
+                                salt: bytes,
+                                data: bytes = b"",
+                                decode_info: str = "",
+                                arbitrary_info: str = "",
+                                gas_limit: Optional[int] = None) -> str:
+        """
+        Sign and broadcast a KnowledgeContract deployment without waiting for it
+
+        Nonces are assigned locally, so several deployments can be sent back to
+        back and then awaited together with wait_for_deployment.
+
+        Args:
+            salt: 32-byte salt value
+            data: Binary data to store
+            decode_info: How to decode the data
+            arbitrary_info: Additional string info
+            gas_limit: Gas limit for transaction
 
+        Returns:
+            Transaction hash
+        """
         if len(salt) != 32:
             raise ValueError("Salt must be exactly 32 bytes")
 
+        # Build transaction (calldata is encoded directly from the precomputed selectors)
+        if data or decode_info or arbitrary_info:
+            # Use deployAndInitialize
+            calldata = DEPLOY_AND_INITIALIZE_SELECTOR + self.w3.codec.encode(
+                DEPLOY_AND_INITIALIZE_ARGS, [salt, data, decode_info, arbitrary_info]
+            )
+        else:
+            # Use deployWithCreate2 only: a static bytes32 argument is the salt itself
+            calldata = DEPLOY_WITH_CREATE2_SELECTOR + salt
+
+        return self._send_factory_transaction(calldata, gas_limit or DEFAULT_DEPLOY_GAS)
+
+    def send_deploy_batch_transaction(self,
+                                      salts: List[bytes],
+                                      datas: List[bytes],
+                                      decode_infos: List[str],
+                                      arbitrary_infos: List[str],
+                                      gas_limit: Optional[int] = None) -> str:
+        """
+        Sign and broadcast one deployAndInitializeBatch transaction without waiting for it
+
+        Requires a Create2Factory build that has deployAndInitializeBatch. The
+        whole transaction reverts if any salt is already deployed.
+
+        Args:
+            salts: 32-byte salt of each contract
+            datas: Binary data to store in each contract
+            decode_infos: How to decode each entry of datas
+            arbitrary_infos: Additional string info for each contract
+            gas_limit: Gas limit per contract (the transaction gets this times the count)
+
+        Returns:
+            Transaction hash
+        """
+        if any(len(salt) != 32 for salt in salts):
+            raise ValueError("Salt must be exactly 32 bytes")
+
+        calldata = DEPLOY_AND_INITIALIZE_BATCH_SELECTOR + self.w3.codec.encode(
+            DEPLOY_AND_INITIALIZE_BATCH_ARGS, [salts, datas, decode_infos, arbitrary_infos]
+        )
+        return self._send_factory_transaction(calldata, (gas_limit or DEFAULT_DEPLOY_GAS) * len(salts))
+
+    def _send_factory_transaction(self, calldata: bytes, gas_limit: int) -> str:
+        """Sign and broadcast a call to the factory with the next local nonce"""
+        if not self.factory_contract or not self.account:
+            raise ValueError("Factory contract and account must be initialized")
+
         try:
-            # Estimate gas if not provided
-            if gas_limit is None:
-                gas_limit = 2000000  # Default gas limit
-
-            # Build transaction
-            if data or decode_info or arbitrary_info:
-                # Use deployAndInitialize
-                tx = self.factory_contract.functions.deployAndInitialize(
-                    salt, data, decode_info, arbitrary_info
-                ).build_transaction({
-                    'from': self.account.address,
-                    'gas': gas_limit,
-                    'gasPrice': self.w3.eth.gas_price,
-                    'nonce': self.w3.eth.get_transaction_count(self.account.address),
-                })
-            else:
-                # Use deployWithCreate2 only
-                tx = self.factory_contract.functions.deployWithCreate2(salt).build_transaction({
+            with self._tx_lock:
+                tx = {
                     'from': self.account.address,
+                    'to': self.factory_contract.address,
+                    'value': 0,
+                    'data': calldata,
                     'gas': gas_limit,
-                    'gasPrice': self.w3.eth.gas_price,
-                    'nonce': self.w3.eth.get_transaction_count(self.account.address),
-                })
+                    **self._next_tx_params(),
+                }
+
+                # Sign and send transaction
+                signed_tx = self.account.sign_transaction(tx)
+                try:
+                    tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+                except Exception as e:
+                    if 'nonce' in str(e).lower():
+                        # Local nonce drifted (e.g. another sender used this account)
+                        self._reset_nonce()
+                    raise
+                self._next_nonce += 1
+
+            return tx_hash.to_0x_hex()
+
+        except Exception as e:
+            raise RuntimeError(f"Failed to deploy contract: {e}")
+
+    def wait_for_deployment(self, tx_hash: str, salt: bytes) -> Tuple[str, str]:
+        """
+        Wait for a deployment sent with send_deploy_transaction to be mined
 
-            # Sign and send transaction
-            signed_tx = self.account.sign_transaction(tx)
-            tx_hash = self.w3.eth.send_raw_transaction(signed_tx.rawTransaction)
+        Args:
+            tx_hash: Transaction hash
+            salt: 32-byte salt the contract was deployed with
 
+        Returns:
+            Tuple of (transaction_hash, deployed_address)
+        """
+        try:
             # Wait for transaction receipt
             receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+            self._balance = None  # gas was spent, even by a reverted transaction
+            if receipt.status == 0:
+                raise RuntimeError(f"transaction {tx_hash} reverted")
 
             # Extract deployed address from Deployed event
             deployed_address = None
             for log in receipt.logs:
-                try:
-                    event = self.factory_contract.events.Deployed().process_log(log)
-                    deployed_address = event.args.addr
-                    break
-                except:
+                # Only logs emitted by the factory with the Deployed topic can decode as Deployed
+                if log.address != self.factory_contract.address or not log.topics or log.topics[0] != self._deployed_topic:
                     continue
+                deployed_address = self._deployed_event.process_log(log).args.addr
+                break
 
             if not deployed_address:
                 # Fallback: compute address directly
                 deployed_address = self.compute_address(salt)
 
-            return tx_hash.hex(), deployed_address
+            # Only a successful receipt proves there is code at the address
+            self._remember_code_flag(_checksum(deployed_address), True)
+            return tx_hash, deployed_address
 
         except Exception as e:
             raise RuntimeError(f"Failed to deploy contract: {e}")
 
+    def wait_for_batch_deployment(self, tx_hash: str) -> Dict[bytes, str]:
+        """
+        Wait for a factory deployment transaction to be mined
+
+        Works for deployAndInitializeBatch as well as single deployments sent with
+        send_deploy_transaction. A reverted transaction raises.
+
+        Args:
+            tx_hash: Transaction hash
+
+        Returns:
+            Mapping of salt to deployed address, taken from the Deployed events
+        """
+        try:
+            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+            self._balance = None  # gas was spent, even by a reverted transaction
+            if receipt.status == 0:
+                raise RuntimeError(f"transaction {tx_hash} reverted")
+
+            deployed: Dict[bytes, str] = {}
+            for log in receipt.logs:
+                if log.address != self.factory_contract.address or not log.topics or log.topics[0] != self._deployed_topic:
+                    continue
+                args = self._deployed_event.process_log(log).args
+                deployed[bytes(args.salt)] = args.addr
+                self._remember_code_flag(_checksum(args.addr), True)
+
+            return deployed
+
+        except Exception as e:
+            raise RuntimeError(f"Failed to deploy contracts: {e}")
+
+    def _read_contract_views(self, address: str) -> Optional[Dict[str, Any]]:
+        """
+        Read all KnowledgeContract view functions in a single round trip
+
+        Args:
+            address: Contract address
+
+        Returns:
+            Dictionary with contract data, or None if there is no code at the address
+            (calls to an empty account succeed with empty return data)
+        """
+        return self._read_many_contract_views([address])[0]
+
+    def _read_many_contract_views(self, addresses: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Read the view functions of many KnowledgeContracts
+
+        Every address contributes one call per view function. With Multicall3 up
+        to MULTICALL_BATCH_ADDRESSES addresses share a single eth_call; without it
+        the plain eth_calls go out as JSON-RPC batch requests of RPC_BATCH_SIZE.
+
+        Args:
+            addresses: Contract addresses
+
+        Returns:
+            One contract info dictionary per address, None where there is no code
+        """
+        views_per_address = len(KNOWLEDGE_CONTRACT_VIEWS)
+        if self.multicall_contract is not None:
+            chunk_size = MULTICALL_BATCH_ADDRESSES
+        else:
+            chunk_size = max(1, RPC_BATCH_SIZE // views_per_address)
+        infos: List[Optional[Dict[str, Any]]] = []
+
+        for start in range(0, len(addresses), chunk_size):
+            chunk = addresses[start:start + chunk_size]
+            checksum_addresses = [_checksum(address) for address in chunk]
+            results = self._call_views(checksum_addresses)
+
+            for i, (address, checksum_address) in enumerate(zip(chunk, checksum_addresses)):
+                view_results = results[i * views_per_address:(i + 1) * views_per_address]
+
+                # The aggregate read doubles as an eth_getCode, so it feeds the deployment cache too
+                if all(success and not return_data for success, return_data in view_results):
+                    self._remember_code_flag(checksum_address, False)
+                    infos.append(None)
+                    continue
+                self._remember_code_flag(checksum_address, True)
+
+                info: Dict[str, Any] = {"address": address}
+                for (key, _, abi_type), (success, return_data) in zip(KNOWLEDGE_CONTRACT_VIEWS, view_results):
+                    if not success:
+                        raise RuntimeError(f"{key} call reverted at {address}")
+                    value = self.w3.codec.decode([abi_type], return_data)[0]
+                    info[key] = value.hex() if abi_type == "bytes" else value
+                infos.append(info)
+
+        return infos
+
+    def _call_views(self, checksum_addresses: List[str]) -> List[Tuple[bool, bytes]]:
+        """(success, return data) of every KnowledgeContract view call, address by address"""
+        if self.multicall_contract is not None:
+            calls = [
+                (checksum_address, True, calldata)
+                for checksum_address in checksum_addresses
+                for _, calldata, _ in KNOWLEDGE_CONTRACT_VIEWS
+            ]
+            return self.multicall_contract.functions.aggregate3(calls).call()
+
+        # A revert fails the whole batch, so every call here reports success
+        with self.w3.batch_requests() as batch:
+            for checksum_address in checksum_addresses:
+                for _, calldata, _ in KNOWLEDGE_CONTRACT_VIEWS:
+                    batch.add(self.w3.eth.call({"to": checksum_address, "data": calldata}))
+            return [(True, bytes(return_data)) for return_data in batch.execute()]
+
     def get_contract_info(self, address: str) -> Dict[str, Any]:
         """
         Get information from a deployed KnowledgeContract
@@ -253,23 +770,47 @@ class BlockchainConnector:
         Returns:
             Dictionary with contract data
         """
-        checksum_address = self.w3.to_checksum_address(address)
-        contract = self.w3.eth.contract(
-            address=checksum_address,
-            abi=KNOWLEDGE_CONTRACT_ABI
-        )
+        try:
+            info = self._read_contract_views(address)
+        except Exception as e:
+            raise RuntimeError(f"Failed to get contract info: {e}")
+        if info is None:
+            raise RuntimeError(f"Failed to get contract info: no contract deployed at {address}")
+        return info
+
+    def find_contract(self, address: str) -> Optional[Dict[str, Any]]:
+        """
+        Return contract info if a KnowledgeContract is deployed at the address
+
+        The existence check and the three view functions share one round trip
+        (a Multicall3 eth_call, or a JSON-RPC batch without Multicall3).
+
+        Args:
+            address: Contract address
 
+        Returns:
+            Dictionary with contract data, or None if nothing is deployed there
+        """
         try:
-            data = contract.functions.getData().call()
-            decode_info = contract.functions.getDecodeInfo().call()
-            arbitrary_info = contract.functions.getArbitraryInfo().call()
+            return self._read_contract_views(address)
+        except Exception as e:
+            raise RuntimeError(f"Failed to get contract info: {e}")
 
-            return {
-                "address": address,
-                "data": data.hex() if data else "",
-                "decode_info": decode_info,
-                "arbitrary_info": arbitrary_info
-            }
+    def find_contracts(self, addresses: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Look up many addresses at once, like find_contract for each of them
+
+        The existence checks and view reads for all addresses go out in as few
+        round trips as possible (see _read_many_contract_views).
+
+        Args:
+            addresses: Contract addresses
+
+        Returns:
+            One contract info dictionary per address, None where nothing is deployed
+        """
+        try:
+            return self._read_many_contract_views(addresses)
         except Exception as e:
             raise RuntimeError(f"Failed to get contract info: {e}")
 
@@ -283,9 +824,59 @@ class BlockchainConnector:
         Returns:
             True if contract exists, False otherwise
         """
-        checksum_address = self.w3.to_checksum_address(address)
-        code = self.w3.eth.get_code(checksum_address)
-        return len(code) > 0
+        checksum_address = _checksum(address)
+        deployed = self._cached_code_flag(checksum_address)
+        if deployed is None:
+            deployed = len(self.w3.eth.get_code(checksum_address)) > 0
+            self._remember_code_flag(checksum_address, deployed)
+        return deployed
+
+    def are_contracts_deployed(self, addresses: List[str]) -> List[bool]:
+        """
+        Check many addresses for deployed code using JSON-RPC batch requests
+
+        Args:
+            addresses: Contract addresses to check
+
+        Returns:
+            One flag per address, True if a contract exists there
+        """
+        checksum_addresses = [_checksum(address) for address in addresses]
+        flags = [self._cached_code_flag(address) for address in checksum_addresses]
+        pending = [i for i, flag in enumerate(flags) if flag is None]
+
+        for start in range(0, len(pending), RPC_BATCH_SIZE):
+            chunk = pending[start:start + RPC_BATCH_SIZE]
+            with self.w3.batch_requests() as batch:
+                for i in chunk:
+                    batch.add(self.w3.eth.get_code(checksum_addresses[i]))
+                codes = batch.execute()
+            for i, code in zip(chunk, codes):
+                flags[i] = len(code) > 0
+                self._remember_code_flag(checksum_addresses[i], flags[i])
+
+        return flags
+
+    def _cached_code_flag(self, checksum_address: str) -> Optional[bool]:
+        """Return the cached deployment flag for an address, or None if it must be fetched"""
+        # Code cannot be removed from an address once deployed, so positives never expire
+        if checksum_address in self._has_code:
+            return True
+        checked_at = self._no_code.get(checksum_address)
+        if checked_at is not None and time.monotonic() - checked_at < CODE_CHECK_TTL:
+            return False
+        return None
+
+    def _remember_code_flag(self, checksum_address: str, deployed: bool):
+        if deployed:
+            if len(self._has_code) >= CODE_CHECK_CACHE_SIZE:
+                self._has_code.clear()
+            self._has_code.add(checksum_address)
+            self._no_code.pop(checksum_address, None)
+        else:
+            if len(self._no_code) >= CODE_CHECK_CACHE_SIZE:
+                self._no_code.clear()
+            self._no_code[checksum_address] = time.monotonic()
 
 class SemIDBlockchainDeployer:
     """Combined class for generating SemID and deploying to blockchain"""
@@ -297,12 +888,51 @@ class SemIDBlockchainDeployer:
         Initialize SemID + Blockchain deployer
 
         Args:
-            semid_instance: SemID instance for ID generation
+            semid_instance: SemID instance for ID generation (None when callers
+                compute SemIDs themselves and only use deploy_from_semid)
             blockchain_connector: BlockchainConnector instance
         """
         self.semid = semid_instance
         self.blockchain = blockchain_connector
 
+        # LRU of (factory, salt) -> (address, contract_info) for initialized contracts.
+        # initialize() can only run once, so this state never changes and needs no expiry.
+        self._deployed_state: "OrderedDict[Tuple[Optional[str], bytes], Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        self._state_lock = threading.Lock()
+
+    def _get_deployed_state(self, salt: bytes) -> Optional[Tuple[str, Dict[str, Any]]]:
+        key = (self.blockchain.factory_address, salt)
+        with self._state_lock:
+            state = self._deployed_state.get(key)
+            if state is not None:
+                self._deployed_state.move_to_end(key)
+            return state
+
+    def _remember_deployed_state(self, salt: bytes, address: str, contract_info: Dict[str, Any]):
+        # A deployed but uninitialized contract reads back all-empty and may still be
+        # initialized by anyone, so only cache state that is known to be final
+        if not (contract_info.get("data") or contract_info.get("decode_info") or contract_info.get("arbitrary_info")):
+            return
+        with self._state_lock:
+            self._deployed_state[(self.blockchain.factory_address, salt)] = (address, contract_info)
+            if len(self._deployed_state) > DEPLOYED_STATE_CACHE_SIZE:
+                self._deployed_state.popitem(last=False)
+
+    def _confirmed_deployment(self, salt: bytes, deployed: Dict[bytes, str], contract_info: Dict[str, Any]) -> str:
+        """
+        Return the address a mined deployment created for the salt
+
+        deployAndInitialize creates and initializes the contract atomically, so a
+        Deployed event in a successful receipt proves the on-chain state matches
+        the values sent. Only then is the state cached; without the event the
+        CREATE2 address is reported but nothing is remembered.
+        """
+        deployed_address = deployed.get(salt)
+        if deployed_address is None:
+            return self.blockchain.compute_address(salt)
+        self._remember_deployed_state(salt, deployed_address, {"address": deployed_address, **contract_info})
+        return deployed_address
+
     def deploy_from_text(self,
                         text: str,
                         data: bytes = b"",
@@ -322,22 +952,65 @@ class SemIDBlockchainDeployer:
         Returns:
             Dictionary with deployment information
         """
-        # Generate SemID and convert to 32-byte salt
+        if self.semid is None:
+            raise ValueError("No SemID instance configured; compute the SemID and call deploy_from_semid")
         semid_value = self.semid.id24(text)
-        salt = semid_value.to_bytes(32, 'big')  # Pad to 32 bytes
+        return self.deploy_from_semid(
+            text,
+            semid_value,
+            data=data,
+            decode_info=decode_info,
+            arbitrary_info=arbitrary_info,
+            gas_limit=gas_limit
+        )
+
+    def deploy_from_semid(self,
+                          text: str,
+                          semid_value: int,
+                          salt: Optional[bytes] = None,
+                          data: bytes = b"",
+                          decode_info: str = "",
+                          arbitrary_info: str = "",
+                          gas_limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Deploy KnowledgeContract for an already computed SemID
+
+        Args:
+            text: Input text the SemID was generated from
+            semid_value: 24-bit SemID of the text
+            salt: Precomputed 32-byte salt (derived from semid_value if omitted)
+            data: Binary data to store in contract
+            decode_info: How to decode the data
+            arbitrary_info: Additional string info (if empty, uses the input text)
+            gas_limit: Gas limit for deployment
+
+        Returns:
+            Dictionary with deployment information
+        """
+        semid_hex = f"{semid_value:06x}"
+        if salt is None:
+            salt = semid_value.to_bytes(32, 'big')  # Pad to 32 bytes
+        salt_hex = SALT_HEX_PAD + semid_hex
 
-        # Compute predicted address
-        predicted_address = self.blockchain.compute_address(salt)
+        # Texts sharing a SemID share the salt, so a known deployment needs no RPC at all
+        state = self._get_deployed_state(salt)
+        if state is not None:
+            predicted_address, contract_info = state
+        else:
+            # Compute predicted address
+            predicted_address = self.blockchain.compute_address(salt)
 
-        # Check if already deployed
-        if self.blockchain.is_contract_deployed(predicted_address):
-            # Get existing contract info
-            contract_info = self.blockchain.get_contract_info(predicted_address)
+            # Check if already deployed (and fetch its info in the same round trip)
+            contract_info = self.blockchain.find_contract(predicted_address)
+            if contract_info is not None:
+                self._remember_deployed_state(salt, predicted_address, contract_info)
+
+        if contract_info is not None:
             return {
                 "text": text,
                 "semid": semid_value,
-                "semid_hex": self.semid.id_hex(text),
-                "salt": salt.hex(),
+                "semid_hex": semid_hex,
+                "salt": salt_hex,
                 "predicted_address": predicted_address,
                 "deployed_address": predicted_address,
                 "already_deployed": True,
@@ -350,21 +1023,155 @@ class SemIDBlockchainDeployer:
             arbitrary_info = text
 
         # Deploy contract
-        tx_hash, deployed_address = self.blockchain.deploy_contract(
-            salt=salt,
-            data=data,
-            decode_info=decode_info,
-            arbitrary_info=arbitrary_info,
-            gas_limit=gas_limit
-        )
+        tx_hash = self.blockchain.send_deploy_transaction(salt, data, decode_info, arbitrary_info, gas_limit)
+        deployed = self.blockchain.wait_for_batch_deployment(tx_hash)
+        deployed_address = self._confirmed_deployment(salt, deployed, {
+            "data": data.hex(),
+            "decode_info": decode_info,
+            "arbitrary_info": arbitrary_info
+        })
 
         return {
             "text": text,
             "semid": semid_value,
-            "semid_hex": self.semid.id_hex(text),
-            "salt": salt.hex(),
+            "semid_hex": semid_hex,
+            "salt": salt_hex,
             "predicted_address": predicted_address,
             "deployed_address": deployed_address,
             "already_deployed": False,
             "transaction_hash": tx_hash
         }
+
+    def deploy_many_from_semids(self,
+                                texts: List[str],
+                                semid_values: List[int],
+                                data_list: Optional[List[bytes]] = None,
+                                decode_info: str = "",
+                                gas_limit: Optional[int] = None,
+                                decode_info_list: Optional[List[str]] = None,
+                                arbitrary_info_list: Optional[List[str]] = None,
+                                batch_size: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Deploy KnowledgeContracts for many already computed SemIDs at once
+
+        Existing deployments are looked up together, then every missing contract
+        is sent back to back with consecutive nonces and the receipts are awaited
+        afterwards, so the batch is mined in about one block instead of one each.
+        With batch_size, up to that many contracts share one
+        deployAndInitializeBatch transaction (the factory must support it).
+
+        Args:
+            texts: Input texts the SemIDs were generated from
+            semid_values: 24-bit SemID of each text
+            data_list: Binary data to store in each contract (empty if omitted)
+            decode_info: How to decode the data (used when decode_info_list is omitted)
+            gas_limit: Gas limit for each deployment
+            decode_info_list: Per-text decode info
+            arbitrary_info_list: Per-text additional string info (empty entries use the text)
+            batch_size: Contracts per factory batch transaction (None sends one transaction each)
+
+        Returns:
+            One dictionary per text, shaped like deploy_from_semid's result
+            (with an "error" key instead for deployments that failed)
+        """
+        count = len(texts)
+        if data_list is None:
+            data_list = [b""] * count
+        if decode_info_list is None:
+            decode_info_list = [decode_info] * count
+        arbitrary_info_list = [
+            info or text for info, text in zip(arbitrary_info_list or [""] * count, texts)
+        ]
+
+        salts = [semid_value.to_bytes(32, 'big') for semid_value in semid_values]
+        results: List[Optional[Dict[str, Any]]] = [None] * count
+
+        def base(i: int, address: str) -> Dict[str, Any]:
+            semid_hex = f"{semid_values[i]:06x}"
+            return {
+                "text": texts[i],
+                "semid": semid_values[i],
+                "semid_hex": semid_hex,
+                "salt": SALT_HEX_PAD + semid_hex,
+                "predicted_address": address,
+                "deployed_address": address,
+            }
+
+        # Known deployments first, then a single aggregated lookup for the rest
+        states = [self._get_deployed_state(salt) for salt in salts]
+        unknown = [i for i, state in enumerate(states) if state is None]
+        addresses = [self.blockchain.compute_address(salts[i]) for i in unknown]
+        for i, address, info in zip(unknown, addresses, self.blockchain.find_contracts(addresses)):
+            if info is not None:
+                self._remember_deployed_state(salts[i], address, info)
+            states[i] = (address, info)
+
+        # Texts sharing a SemID deploy once, through the first of them
+        first_index: Dict[bytes, int] = {}
+        for i, (address, info) in enumerate(states):
+            if info is None:
+                first_index.setdefault(salts[i], i)
+        to_deploy = list(first_index.values())
+
+        # Send every transaction without waiting
+        step = batch_size or 1
+        groups: List[Tuple[List[int], Optional[str], Optional[str]]] = []  # (indices, tx_hash, error)
+        for start in range(0, len(to_deploy), step):
+            group = to_deploy[start:start + step]
+            try:
+                if batch_size:
+                    tx_hash = self.blockchain.send_deploy_batch_transaction(
+                        [salts[i] for i in group],
+                        [data_list[i] for i in group],
+                        [decode_info_list[i] for i in group],
+                        [arbitrary_info_list[i] for i in group],
+                        gas_limit
+                    )
+                else:
+                    i = group[0]
+                    tx_hash = self.blockchain.send_deploy_transaction(
+                        salts[i], data_list[i], decode_info_list[i], arbitrary_info_list[i], gas_limit
+                    )
+                groups.append((group, tx_hash, None))
+            except Exception as e:
+                groups.append((group, None, str(e)))
+
+        # Await the receipts; they were all broadcast before the first wait.
+        # A reverted transaction (status 0) raises and fails its whole group.
+        errors: Dict[bytes, str] = {}
+        for group, tx_hash, error in groups:
+            if tx_hash is not None:
+                try:
+                    deployed = self.blockchain.wait_for_batch_deployment(tx_hash)
+                except Exception as e:
+                    error = str(e)
+
+            for i in group:
+                if error is not None:
+                    errors[salts[i]] = error
+                    results[i] = {"text": texts[i], "semid": semid_values[i], "error": error}
+                    continue
+                info = {
+                    "data": data_list[i].hex(),
+                    "decode_info": decode_info_list[i],
+                    "arbitrary_info": arbitrary_info_list[i]
+                }
+                deployed_address = self._confirmed_deployment(salts[i], deployed, info)
+                states[i] = (deployed_address, {"address": deployed_address, **info})
+                results[i] = {**base(i, deployed_address), "already_deployed": False, "transaction_hash": tx_hash}
+
+        for i, salt in enumerate(salts):
+            if results[i] is not None:
+                continue
+            if salt in errors:
+                results[i] = {"text": texts[i], "semid": semid_values[i], "error": errors[salt]}
+                continue
+            address, info = states[first_index.get(salt, i)]
+            results[i] = {
+                **base(i, address),
+                "already_deployed": True,
+                "contract_info": info,
+                "transaction_hash": None
+            }
+
+        return results
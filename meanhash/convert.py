@@ -1,21 +1,95 @@
 import itertools
+import numpy as np
 # from core import TransferPosition  # TransferPosition is not implemented yet
 def hamming_distance(a: str, b: str) -> int:
     """Compute the Hamming distance between two equal-length bit-strings."""
     if len(a) != len(b):
         raise ValueError("Bit-strings must have the same length.")
-    return sum(x != y for x in a for x, y in zip(a, b))   # OOPS, that was a mistake. We do sum(x != y for x, y in zip(a, b)).
+    if not a:
+        return 0
+    # XOR + popcount on Python ints runs in C instead of a per-character loop
+    return (int(a, 2) ^ int(b, 2)).bit_count()
 
 class ApproximateBitstring:
     """
     Groups bit-strings into the same 'approximate' label if they are within
     Hamming distance n of any existing cluster representative.
-    This is a naive approach that can grow in memory for many inputs,
-    but demonstrates the concept.
+    At most `maxlen` clusters are kept; the least recently hit one is
+    evicted to make room for a new cluster.
     """
-    def __init__(self):
-        # Map "representative_bitstring" -> "shared label"
-        self.clusters = {}
+    # Width of the bit slices used as LSH bucket keys
+    BUCKET_BITS = 16
+
+    def __init__(self, maxlen: int = 10_000):
+        if maxlen < 1:
+            raise ValueError("maxlen must be at least 1.")
+        self.maxlen = maxlen
+        # Struct-of-arrays store: row i of `reps` is the bit-packed representative
+        # (little-endian uint64 words) whose label is `labels[i]` and int value `values[i]`.
+        self.nbits = None
+        self.words = 0
+        self.reps = np.empty((0, 0), dtype=np.uint64)
+        self.labels = []
+        self.values = []
+        # Logical clock of the last hit per row, used for LRU eviction
+        self.last_used = np.empty(0, dtype=np.int64)
+        self._clock = 0
+        # Row of the most recently hit cluster, checked before any bucket lookup
+        self._mru = None
+        # buckets[k] maps the value of bit slice k -> row indices sharing it
+        self.buckets = []
+
+    def _slices(self, value: int):
+        mask = (1 << self.BUCKET_BITS) - 1
+        return [(value >> (k * self.BUCKET_BITS)) & mask for k in range(len(self.buckets))]
+
+    def _pack(self, value: int) -> np.ndarray:
+        """Pack an int into `self.words` little-endian uint64 words."""
+        return np.frombuffer(value.to_bytes(self.words * 8, "little"), dtype="<u8")
+
+    def _add(self, value: int, packed: np.ndarray, label: str) -> int:
+        size = len(self.labels)
+        if size >= self.maxlen:
+            # Full: reuse the row of the least recently hit cluster
+            row = int(np.argmin(self.last_used[:size]))
+            for bucket, key in zip(self.buckets, self._slices(self.values[row])):
+                members = bucket[key]
+                members.remove(row)
+                if not members:
+                    del bucket[key]
+            self.labels[row] = label
+            self.values[row] = value
+        else:
+            if size == self.reps.shape[0]:
+                # Grow geometrically so inserts stay amortised O(1)
+                capacity = min(2 * size, self.maxlen)
+                grown = np.empty((capacity, self.words), dtype=np.uint64)
+                grown[:size] = self.reps[:size]
+                self.reps = grown
+                self.last_used = np.resize(self.last_used, capacity)
+            row = size
+            self.labels.append(label)
+            self.values.append(value)
+        self.reps[row] = packed
+        for bucket, key in zip(self.buckets, self._slices(value)):
+            bucket.setdefault(key, []).append(row)
+        return row
+
+    def _candidates(self, value: int, n: int) -> np.ndarray:
+        """
+        Rows that may lie within distance n of `value`.
+
+        The bit-string is split into K disjoint slices; by pigeonhole, a
+        representative within distance n < K matches at least one slice
+        exactly, so probing the K buckets loses nothing. For larger n every
+        row is a candidate.
+        """
+        if n >= len(self.buckets):
+            return np.arange(len(self.labels))
+        rows = set()
+        for bucket, key in zip(self.buckets, self._slices(value)):
+            rows.update(bucket.get(key, ()))
+        return np.fromiter(sorted(rows), dtype=np.intp, count=len(rows))
 
     def approximate_bitstring(self, bitstring: str, n: int) -> str:
         """
@@ -23,23 +97,40 @@ class ApproximateBitstring:
         within Hamming distance n from a known cluster representative
         shares the same label.
         """
-        for rep, label in self.clusters.items():
-            if hamming_distance(bitstring, rep) <= n:
-                # Found an existing cluster whose representative is close enough
-                return label
+        if self.nbits is None:
+            self.nbits = len(bitstring)
+            self.words = max(1, -(-self.nbits // 64))
+            self.reps = np.empty((min(16, self.maxlen), self.words), dtype=np.uint64)
+            self.last_used = np.zeros(self.reps.shape[0], dtype=np.int64)
+            self.buckets = [{} for _ in range(max(1, -(-self.nbits // self.BUCKET_BITS)))]
+        elif len(bitstring) != self.nbits:
+            raise ValueError("Bit-strings must have the same length.")
 
-        # Otherwise, this bitstring starts a new cluster. We use the bitstring
-        # itself as the 'label' to keep it simple.
-        self.clusters[bitstring] = bitstring
-        return bitstring
+        value = int(bitstring or "0", 2)
+        query = self._pack(value)
+        self._clock += 1
 
-# Fix the Hamming distance function (typo correction):
-def hamming_distance(a: str, b: str) -> int:
-    """Compute the Hamming distance between two equal-length bit-strings."""
-    if len(a) != len(b):
-        raise ValueError("Bit-strings must have the same length.")
-    return sum(x != y for x, y in zip(a, b))
+        # Nearby inputs tend to arrive together, so try the last hit cluster first
+        row = self._mru
+        if row is None or np.bitwise_count(self.reps[row] ^ query).sum() > n:
+            row = None
+            rows = self._candidates(value, n)
+            if rows.size:
+                # One vectorised XOR + popcount over the candidate representatives
+                dist = np.bitwise_count(self.reps[rows] ^ query).sum(axis=1)
+                hits = np.flatnonzero(dist <= n)
+                if hits.size:
+                    # Found an existing cluster whose representative is close enough
+                    row = int(rows[hits[0]])
+
+        if row is None:
+            # Otherwise, this bitstring starts a new cluster. We use the bitstring
+            # itself as the 'label' to keep it simple.
+            row = self._add(value, query, bitstring)
 
+        self._mru = row
+        self.last_used[row] = self._clock
+        return self.labels[row]
 
 
 if __name__ == "__main__":
@@ -1,22 +1,35 @@
 # semid_en_g_v1.py  (G案: ECC丸め / ラウンド無し)
 import os
+import functools
+import itertools
 import numpy as np
 import hashlib, unicodedata, re
 from sentence_transformers import SentenceTransformer
 
-# ===== 推奨: 数値ゆれ低減（必要ならコメント解除） =====
+# ===== 数値ゆれ低減（マシン間で BLAS の加算順まで揃えたい場合のみコメント解除。スループットは落ちる） =====
 # os.environ.setdefault("MKL_NUM_THREADS", "1")
 # os.environ.setdefault("OMP_NUM_THREADS", "1")
 
 # ===== 設定（固定値。全ノード同一に） =====
 MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"  # モデルは運用で固定推奨（revision固定推奨）
 SEED_BASE  = "semaddr-en-g-v1"                         # 乱数の根っこ（変えないこと）
+ID_CACHE_SIZE = 4096  # 正規化済みテキスト → 24bit ID のキャッシュ件数
+# 推論バックエンド: "torch"（既定）/ "onnx" / "openvino"。ONNX は `uv sync --extra onnx` が必要。
+# バックエンドや量子化が違うと符号境界付近の ID が変わりうるので、全ノードで同じ設定に揃えること
+EMBED_BACKEND = os.environ.get("SEMID_BACKEND", "torch")
+ONNX_FILE = os.environ.get("SEMID_ONNX_FILE")  # 例: "onnx/model_qint8_avx512_vnni.onnx"（INT8 動的量子化済み）
+# 生成済み W の保存先（.npy を mmap で読むので起動時の乱数生成を省ける）。空文字で無効化
+# パッケージ配下は読み取り専用のことがあるので、既定はユーザーのキャッシュディレクトリ（mcp_server の sqlite と同じ場所）
+W_CACHE_DIR = os.path.expanduser(os.environ.get("SEMID_W_CACHE_DIR", "~/.cache/semid"))
+W_CACHE_VERSION = 1  # W の作り方を変えたら上げる（ファイル名に入る）
 L = 2          # ヘッド数（2ヘッド×12bit = 24bit）
 N = 24         # 各ヘッドのサインビット数（Golayの符号長）
 EPS = 1e-5     # タイブレーク閾値（符号境界の決定性を強める）
 
 # ===== ユーティリティ =====
 def _hash32(s: str) -> int:
+    # W の乱数シードは ID 互換性の一部なので SHA-256 から変えないこと（blake3 等に替えると全 ID が変わる）
+    # hashlib は OpenSSL 実装なので、SHA-NI を持つ CPU ではハードウェア命令が自動で使われる
     return int.from_bytes(hashlib.sha256(s.encode("utf-8")).digest()[:4], "big")
 
 def text_norm(s: str) -> str:
@@ -34,17 +47,37 @@ def sign_with_tie(u: np.ndarray, text_normed: str, head_idx: int) -> np.ndarray:
     mask = np.abs(u) < EPS
     if mask.any():
         idxs = np.where(mask)[0]
-        for j in idxs:
-            h = hashlib.sha256(f"tb:v1|{text_normed}|{head_idx}|{j}".encode("utf-8")).digest()
-            bits[j] = h[0] & 1
+        bits[idxs] = _tie_bits(text_normed, head_idx, idxs)
     return bits  # shape: (N,), dtype=uint8
 
+def _tie_bits(text_normed: str, head_idx: int, js) -> list:
+    # 符号境界上のビットは "tb:v1|{text}|{head}|{j}" の SHA256 先頭バイトの LSB で決める
+    # 共通の接頭辞まで食わせたハッシュを copy() して j だけ足す（ダイジェストは一括で計算した場合と同一）
+    prefix = hashlib.sha256(f"tb:v1|{text_normed}|{head_idx}|".encode("utf-8"))
+    out = []
+    for j in js:
+        h = prefix.copy()
+        h.update(str(int(j)).encode("ascii"))
+        out.append(h.digest()[0] & 1)
+    return out
+
+def _aligned_empty(shape, dtype, align: int = 64) -> np.ndarray:
+    # 先頭アドレスを align バイト境界に揃えた C 連続配列（AVX-512 のロード幅に合わせる）
+    dtype = np.dtype(dtype)
+    nbytes = int(np.prod(shape)) * dtype.itemsize
+    buf = np.empty(nbytes + align, dtype=np.uint8)
+    offset = -buf.ctypes.data % align
+    return buf[offset:offset + nbytes].view(dtype).reshape(shape)
+
 # ===== 拡張Golay [24,12,8]（最近傍復号） =====
 class Golay24:
     """
     拡張 Golay コード [24,12,8]
     - 構成: [23,12,7] の巡回Golayの生成多項式 g(x) で体系化エンコード → 偶数パリティ拡張
     - 復号: 4096 語のコードブックに対する最小ハミング距離（半径3まで確実訂正）
+      （numpy 配列化したコードブックとの XOR + np.bitwise_count（POPCNT）でまとめて計算）
+    - 高速経路: [23,12] Golay は完全符号なので、2048 通りのシンドロームが重み3以下の誤りパタンと 1 対 1。
+      表引きで訂正した結果が 24bit で距離3以下なら最近傍が一意に確定するので、全件走査を省く
     """
     def __init__(self):
         # g(x) = x^11 + x^9 + x^7 + x^6 + x^5 + x + 1
@@ -52,7 +85,12 @@ class Golay24:
         self.n = 23
         self.k = 12
         self.r = self.n - self.k  # 11
+        # 体系化エンコーダの生成行: rows[i] = 単位メッセージ (1<<i) の 23bit 符号語（線形なので XOR で合成できる）
+        self._rows23 = [self._encode23_poly(1 << i) for i in range(self.k)]
         self._codebook24 = self._build_codebook24()  # list[int] length 4096
+        self._cb = np.array(self._codebook24, dtype=np.uint32)  # (4096,)
+        self._pow2 = np.uint32(1) << np.arange(24, dtype=np.uint32)  # bit j の重み
+        self._syn_lo, self._syn_hi, self._syn_to_err = self._build_syndrome_tables()
 
     @staticmethod
     def _poly_deg(p: int) -> int:
@@ -68,31 +106,70 @@ class Golay24:
             r ^= divisor << shift
         return q, r  # (quotient, remainder)
 
-    def _encode23(self, m: int) -> int:
+    def _encode23_poly(self, m: int) -> int:
         # 体系化: c(x) = m(x) * x^r + rem( m(x)*x^r , g(x) )
         mshift = m << self.r
         _, rem = self._poly_divmod(mshift, self.g)
         return mshift ^ rem  # 23-bit int
 
+    def _encode23(self, m: int) -> int:
+        # 立っているメッセージビットに対応する生成行の XOR
+        cw = 0
+        for i, row in enumerate(self._rows23):
+            if (m >> i) & 1:
+                cw ^= row
+        return cw  # 23-bit int
+
     def _extend24(self, cw23: int) -> int:
         # 偶数パリティ拡張（全24bitの1の数を偶数に）
         parity = cw23.bit_count() & 1
         return cw23 | (parity << 23)  # parity は bit 23（MSB側）に置く
 
     def _build_codebook24(self):
-        code23 = [self._encode23(m) for m in range(1 << self.k)]
+        # Gray コード順に辿ると隣り合うメッセージは 1bit 違いなので、符号語も生成行 1 本の XOR で更新できる
+        code23 = [0] * (1 << self.k)
+        cw = 0
+        prev = 0
+        for step in range(1, 1 << self.k):
+            gray = step ^ (step >> 1)
+            cw ^= self._rows23[(gray ^ prev).bit_length() - 1]
+            code23[gray] = cw
+            prev = gray
         code24 = [self._extend24(cw) for cw in code23]
         return code24
 
-    @staticmethod
-    def _bits_to_int(bits: np.ndarray) -> int:
-        # bits[j] が bit j（LSB）を表す前提
-        v = 0
-        # np.uint8 -> python int
-        for j, b in enumerate(bits.tolist()):
-            if b & 1:
-                v |= (1 << j)
-        return v
+    def _build_syndrome_tables(self):
+        # シンドローム s(v) = v(x) mod g(x) は線形なので、下位12bit / 上位11bit の表の XOR で引ける
+        syn_bit = [self._poly_divmod(1 << i, self.g)[1] for i in range(self.n)]
+        lo = [0] * (1 << 12)
+        for x in range(1, 1 << 12):
+            lo[x] = lo[x & (x - 1)] ^ syn_bit[(x & -x).bit_length() - 1]
+        hi = [0] * (1 << (self.n - 12))
+        for y in range(1, 1 << (self.n - 12)):
+            hi[y] = hi[y & (y - 1)] ^ syn_bit[12 + (y & -y).bit_length() - 1]
+        # 重み0..3 の誤りパタン（1+23+253+1771 = 2048 通り）がシンドロームを一巡する
+        err = np.zeros(1 << self.r, dtype=np.uint32)
+        for w in range(1, 4):
+            for pos in itertools.combinations(range(self.n), w):
+                e = sum(1 << p for p in pos)
+                err[lo[e & 0xFFF] ^ hi[e >> 12]] = e
+        return np.array(lo, dtype=np.uint32), np.array(hi, dtype=np.uint32), err
+
+    def _syndrome_decode(self, words: np.ndarray):
+        """
+        words: 24bit 語の uint32 配列 → (12bit メッセージ, 確定フラグ)
+        確定フラグが False の語（距離4の同点を含みうる）はコードブック走査に回す
+        """
+        v23 = words & np.uint32((1 << self.n) - 1)
+        err = self._syn_to_err[self._syn_lo[v23 & np.uint32(0xFFF)] ^ self._syn_hi[v23 >> np.uint32(12)]]
+        cw23 = v23 ^ err
+        parity_miss = (np.bitwise_count(cw23) & 1) != (words >> np.uint32(self.n)) & 1
+        dist = np.bitwise_count(err) + parity_miss
+        return (cw23 >> np.uint32(self.r)).astype(np.int64), dist <= 3
+
+    def _bits_to_int(self, bits: np.ndarray) -> int:
+        # bits[j] が bit j（LSB）を表す前提。2^j との内積で 1 回にまとめる
+        return int((bits & 1).astype(np.uint32) @ self._pow2)
 
     def decode_to_msg12(self, bits: np.ndarray) -> int:
         """
@@ -100,63 +177,131 @@ class Golay24:
         出力: 12bit メッセージ（0..4095）※最近傍（ハミング距離最小、同点は最小index）
         """
         v = self._bits_to_int(bits)
-        best_idx = 0
-        best_d = 1 << 30
-        for idx, cw in enumerate(self._codebook24):
-            d = (cw ^ v).bit_count()
-            if d < best_d:
-                best_d = d
-                best_idx = idx
-                if d == 0:
-                    break
-        return best_idx  # 12bit int
+        v23 = v & ((1 << self.n) - 1)
+        err = int(self._syn_to_err[self._syn_lo[v23 & 0xFFF] ^ self._syn_hi[v23 >> 12]])
+        cw23 = v23 ^ err
+        if err.bit_count() + ((cw23.bit_count() ^ (v >> self.n)) & 1) <= 3:
+            return cw23 >> self.r  # 距離3以下: 最近傍は一意
+        d = np.bitwise_count(self._cb ^ np.uint32(v))
+        return int(d.argmin())  # 12bit int（argmin は同点なら最小 index を返す）
+
+    def decode_words_to_msg12(self, words: np.ndarray, chunk: int = 256) -> np.ndarray:
+        """
+        入力: 24bit 語（bit j が j 番目のビット）の整数配列
+        出力: 各語の 12bit メッセージ配列。decode_to_msg12 と同じ規則（同点は最小index）
+        （(語数, 4096) の距離表は chunk 行ずつ作ってメモリを抑える）
+        """
+        words = np.asarray(words, dtype=np.uint32).ravel()
+        out, ok = self._syndrome_decode(words)
+        rest = np.flatnonzero(~ok)  # 距離4以上の語だけ全件走査
+        for s in range(0, rest.shape[0], chunk):
+            idx = rest[s:s + chunk]
+            d = np.bitwise_count(words[idx, None] ^ self._cb[None, :])
+            out[idx] = d.argmin(axis=1)
+        return out
 
 # ===== SemID（G案） =====
 class SemID:
-    def __init__(self, model_name: str = MODEL_NAME, seed_base: str = SEED_BASE):
+    def __init__(self, model_name: str = MODEL_NAME, seed_base: str = SEED_BASE, backend: str = EMBED_BACKEND):
         # 埋め込みモデル（CPU固定）
         # revision を固定するとより堅牢: SentenceTransformer(model_name, device="cpu", revision="<commit>")
-        self.model = SentenceTransformer(model_name, device="cpu")
+        kwargs = {}
+        if backend != "torch":
+            # ONNX Runtime / OpenVINO で推論（mean pooling と正規化は sentence-transformers 側で同じように行われる）
+            kwargs["backend"] = backend
+            if ONNX_FILE:
+                kwargs["model_kwargs"] = {"file_name": ONNX_FILE}
+        self.model = SentenceTransformer(model_name, device="cpu", **kwargs)
         self.seed_base = seed_base
 
         # 乱数から W を作る（埋め込み次元 d が分かってから列正規化）
-        self.W = None  # shape: (L, d, N)
+        self.W = None  # shape: (d, L*N)、列 i*N+j = ヘッド i のビット j
 
         # Golay 復号器（共有でOK）
         self.golay = Golay24()
 
+        # 同じテキスト（正規化後）の再計算で推論を繰り返さないよう、インスタンスごとに LRU で保持
+        self._id24_cached = functools.lru_cache(maxsize=ID_CACHE_SIZE)(self._id24_impl)
+
     def _ensure_W(self, dim: int):
         if self.W is not None:
             return
-        Ws = []
+        cache_path = None
+        if W_CACHE_DIR:
+            # seed_base は任意文字列（"/" や ".." を含みうる）なので、ファイル名には生成条件のハッシュだけを使う
+            key = hashlib.sha256(f"{W_CACHE_VERSION}|{self.seed_base}|{dim}|{L}|{N}".encode("utf-8")).hexdigest()[:32]
+            cache_path = os.path.join(W_CACHE_DIR, f"W_v{W_CACHE_VERSION}_{key}.npy")
+            try:
+                W = np.load(cache_path, mmap_mode="r")  # .npy のデータ部は 64B 境界に置かれる
+                if W.shape == (dim, L * N) and W.dtype == np.float32:
+                    self.W = W
+                    return
+            except (OSError, ValueError):
+                pass
+        # 全ヘッドを 1 回の GEMM で射影できるよう (d, L*24) の C 連続・64B 境界の 1 枚に詰める
+        W_all = _aligned_empty((dim, L * N), np.float32)
         for i in range(L):
             seed_w = _hash32(f"{self.seed_base}::head{i}::W")
             rng = np.random.RandomState(seed_w)
             W = rng.normal(size=(dim, N)).astype(np.float32)  # (d, 24)
             W /= (np.linalg.norm(W, axis=0, keepdims=True) + 1e-12)
-            Ws.append(W)
-        self.W = np.stack(Ws, axis=0)  # (L, d, 24)
+            W_all[:, i * N:(i + 1) * N] = W
+        self.W = W_all
+        if cache_path:
+            # 並行プロセスが書きかけを読まないよう一時ファイル経由で置き換える
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            try:
+                os.makedirs(W_CACHE_DIR, exist_ok=True)
+                with open(tmp_path, "wb") as f:
+                    np.save(f, W_all)
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                pass  # 書き込めない環境では毎回生成する
 
     def embed(self, text: str):
         t = text_norm(text)
         x = self.model.encode([t], normalize_embeddings=True)[0].astype(np.float32)  # (d,)
         return t, x
 
+    def _ids_from_embeddings(self, ts, xs: np.ndarray) -> list:
+        """
+        ts: 正規化済みテキスト (B,), xs: 埋め込み (B, d) → 24bit ID のリスト
+        射影・符号化・復号を全ヘッド × 全テキストでまとめて行う
+        """
+        self._ensure_W(xs.shape[1])
+
+        U = (xs @ self.W).reshape(-1, L, N)  # (B, L, 24)（全ヘッドを 1 回の GEMM で）
+        bits = (U >= 0).astype(np.uint8)
+        # タイブレーク対象（|u|<EPS）は稀なので、該当セルだけ sign_with_tie と同じハッシュで埋める
+        for b, i in np.argwhere((np.abs(U) < EPS).any(axis=2)):
+            js = np.flatnonzero(np.abs(U[b, i]) < EPS)
+            bits[b, i, js] = _tie_bits(ts[b], i, js)
+
+        words = bits.astype(np.uint32) @ self.golay._pow2              # (B, L)
+        msgs = self.golay.decode_words_to_msg12(words).reshape(-1, L)  # (B, L)
+        return ((msgs[:, 0] << 12) | msgs[:, 1]).tolist()
+
+    def _id24_from_embedding(self, t: str, x: np.ndarray) -> int:
+        return self._ids_from_embeddings([t], x[None, :])[0]
+
+    def _id24_impl(self, t: str) -> int:
+        # t は text_norm 済み
+        x = self.model.encode([t], normalize_embeddings=True)[0].astype(np.float32)  # (d,)
+        return self._id24_from_embedding(t, x)
+
     def id24(self, text: str) -> int:
         """
         2ヘッド×12bit を連結した 24bit ID を返す。
         """
-        t, x = self.embed(text)
-        self._ensure_W(x.shape[0])
-
-        parts = []
-        for i in range(L):
-            u = x @ self.W[i]                 # (24,)
-            bits = sign_with_tie(u, t, i)     # 0/1 × 24
-            msg12 = self.golay.decode_to_msg12(bits)  # 0..4095
-            parts.append(msg12)
+        return self._id24_cached(text_norm(text))
 
-        return (parts[0] << 12) | parts[1]
+    def id24_batch(self, texts):
+        """
+        複数テキストの 24bit ID をまとめて返す。結果は id24 をテキストごとに呼んだ場合とビット単位で同一。
+        （パディング入りのバッチ推論は埋め込みが 1e-7 程度ずれ、符号境界付近のビットが反転して ID が変わりうるので、
+          推論は 1 テキストずつパディング無しで行い、id24 と同じ LRU を共有する）
+        """
+        return [self._id24_cached(text_norm(s)) for s in texts]
 
     def id_bytes(self, text: str) -> bytes:
         v = self.id24(text)
@@ -167,11 +312,6 @@ class SemID:
 
     def id_parts(self, text: str):
         """デバッグ用途: (head0の12bit, head1の12bit, 連結24bit)"""
-        t, x = self.embed(text)
-        self._ensure_W(x.shape[0])
-        a = []
-        for i in range(L):
-            u = x @ self.W[i]
-            bits = sign_with_tie(u, t, i)
-            a.append(self.golay.decode_to_msg12(bits))
-        return a[0], a[1], (a[0] << 12) | a[1]
+        # 24bit ID は (head0 << 12) | head1 なので、再推論せずキャッシュ済みの id24 から分解する
+        v = self.id24(text)
+        return v >> 12, v & 0xFFF, v
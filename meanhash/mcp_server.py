@@ -1,57 +1,422 @@
-from typing import Any, Optional, Dict
-import httpx
+from typing import Any, Optional, Dict, List, Tuple, TYPE_CHECKING
+import asyncio
+import binascii
+from collections import OrderedDict
+import itertools
+import json
+from functools import lru_cache, wraps
+import math
+import numpy as np
 import os
+import sqlite3
+import threading
+import time
 from mcp.server.fastmcp import FastMCP
-from core import SemID
-from blockchain_integration import BlockchainConnector, SemIDBlockchainDeployer
 
 # Initialize FastMCP server
+# The SDK already dispatches every incoming request as its own task, so concurrent
+# tool calls overlap as long as a tool does not block the event loop (blocking work
+# goes through asyncio.to_thread). JSON-RPC batch arrays are not part of the current
+# MCP spec and clients do not send them, so the stdio transport is left as is.
 mcp = FastMCP("world_context_protocol")
 
-# SemIDインスタンスをグローバルに作成（モデルロードを一度だけ）
-semid_instance = SemID()
+# 埋め込みモデル（core → torch / sentence-transformers）とweb3（blockchain_integration）は重いので、
+# それを使うツールが初めて呼ばれるまでimportしない
+if TYPE_CHECKING:
+    from core import SemID
+    from blockchain_integration import BlockchainConnector, SemIDBlockchainDeployer
+
 private_key = os.getenv("BLOCKCHAIN_PRIVATE_KEY")
 
-# ブロックチェーンコネクタ（環境変数から設定）
-blockchain_connector: Optional[BlockchainConnector] = None
-deployer: Optional[SemIDBlockchainDeployer] = None
+# ブロックチェーンコネクタ（初回呼び出しで生成し、以降はキャッシュを返す）
+# lru_cache だけでは同時の初回呼び出しで本体が二重に走りうるので、生成自体はロックの内側で 1 回だけ行う
+_factory_lock = threading.RLock()
+
 
-def get_blockchain_connector() -> BlockchainConnector:
+@lru_cache(maxsize=None)
+def get_blockchain_connector() -> "BlockchainConnector":
     """Get or create blockchain connector from environment variables"""
-    global blockchain_connector
+    with _factory_lock:
+        return _create_blockchain_connector()
 
-    if blockchain_connector is None:
-        rpc_url = "https://eth-sepolia.g.alchemy.com/v2/xCvVMlO5hVjJ6_w5uJ4EQjSZ0RKiI7ym"
-        factory_address = "0x35B586834b11dCa235B1007Faa312AA523aB6802"
 
-        if not rpc_url:
-            raise ValueError("BLOCKCHAIN_RPC_URL environment variable not set")
+@lru_cache(maxsize=None)
+def _create_blockchain_connector() -> "BlockchainConnector":
+    from blockchain_integration import BlockchainConnector
+
+    rpc_url = "https://eth-sepolia.g.alchemy.com/v2/xCvVMlO5hVjJ6_w5uJ4EQjSZ0RKiI7ym"
+    factory_address = "0x35B586834b11dCa235B1007Faa312AA523aB6802"
+
+    if not rpc_url:
+        raise ValueError("BLOCKCHAIN_RPC_URL environment variable not set")
+
+    try:
+        return BlockchainConnector(
+            rpc_url=rpc_url,
+            private_key=private_key,
+            factory_address=factory_address
+        )
+    except Exception as e:
+        raise ValueError(f"Failed to connect to blockchain: {e}")
+
+
+@lru_cache(maxsize=None)
+def _semid() -> "SemID":
+    """Get or create the SemID instance (the embedding model is loaded on first use)"""
+    with _factory_lock:
+        return _load_semid()
 
-        try:
-            blockchain_connector = BlockchainConnector(
-                rpc_url=rpc_url,
-                private_key=private_key,
-                factory_address=factory_address
-            )
-        except Exception as e:
-            raise ValueError(f"Failed to connect to blockchain: {e}")
 
-    return blockchain_connector
+@lru_cache(maxsize=None)
+def _load_semid() -> "SemID":
+    # CPU推論で全コアを使う（モデルロード前に設定する）
+    import torch
+    from core import SemID
 
-def get_deployer() -> SemIDBlockchainDeployer:
+    os.environ.setdefault("TOKENIZERS_PARALLELISM", "true")
+    torch.set_num_threads(os.cpu_count() or 4)
+    torch.set_num_interop_threads(2)
+    return SemID()
+
+
+@lru_cache(maxsize=None)
+def get_deployer() -> "SemIDBlockchainDeployer":
     """Get or create SemID blockchain deployer"""
-    global deployer
+    with _factory_lock:
+        return _create_deployer()
 
-    if deployer is None:
-        connector = get_blockchain_connector()
-        deployer = SemIDBlockchainDeployer(semid_instance, connector)
 
-    return deployer
+@lru_cache(maxsize=None)
+def _create_deployer() -> "SemIDBlockchainDeployer":
+    from blockchain_integration import SemIDBlockchainDeployer
+
+    return SemIDBlockchainDeployer(_semid(), get_blockchain_connector())
+
+
+# The salt is the 24-bit SemID left-padded to 32 bytes, so its hex is a fixed zero prefix + semid_hex
+_SALT_HEX_PAD = "00" * 29
+
+
+@lru_cache(maxsize=4096)
+def _semid_bundle(text: str) -> Tuple[int, str, bytes]:
+    """(SemID, 6-char hex, 32-byte salt) for a text, computed with a single id24 call"""
+    semid_value = _locked_semid_call("id24", text)
+    return semid_value, f"{semid_value:06x}", semid_value.to_bytes(32, 'big')
+
+
+@lru_cache(maxsize=100_000)
+def _compute_addr(semid_value: int) -> str:
+    """Predicted KnowledgeContract address for a SemID (the connector and factory are fixed per process)"""
+    return get_blockchain_connector().compute_semid_address(semid_value)
+
+
+@lru_cache(maxsize=10_000)
+def _predict_static(text: str) -> Tuple[int, str, str, str]:
+    """(SemID, 6-char hex, salt hex, predicted address) for a text; only deployment state can change"""
+    semid_value, semid_hex, _ = _semid_bundle(text)
+    return semid_value, semid_hex, _SALT_HEX_PAD + semid_hex, _compute_addr(semid_value)
+
+
+# KnowledgeContracts are write-once, so initialized contract info is persisted locally
+# (keyed on chain id + address) and repeat lookups skip the RPC round-trip
+CONTRACT_INFO_CACHE_PATH = os.path.expanduser(
+    os.getenv("SEMID_INFO_CACHE_PATH", "~/.cache/semid/contract_info.sqlite3")
+)
+_info_db_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _info_db() -> Optional[sqlite3.Connection]:
+    """Open the contract info store, or None if it cannot be created (lookups then go to the chain)"""
+    try:
+        os.makedirs(os.path.dirname(CONTRACT_INFO_CACHE_PATH), exist_ok=True)
+        db = sqlite3.connect(CONTRACT_INFO_CACHE_PATH, check_same_thread=False, isolation_level=None)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS contract_info ("
+            "chain_id INTEGER NOT NULL, address TEXT NOT NULL, info TEXT NOT NULL, "
+            "PRIMARY KEY (chain_id, address))"
+        )
+        return db
+    except sqlite3.Error:
+        return None
+
+
+def _is_initialized(info: Dict[str, Any]) -> bool:
+    """An uninitialized contract still has empty fields and may be initialized later"""
+    return bool(info["data"] or info["decode_info"] or info["arbitrary_info"])
+
+
+def _find_contracts_cached(connector: "BlockchainConnector", addresses: List[str]) -> List[Optional[Dict[str, Any]]]:
+    """connector.find_contracts, served from the local store where possible"""
+    db = _info_db()
+    if db is None:
+        return connector.find_contracts(addresses)
+
+    chain_id = connector.get_chain_id()
+    keys = [address.lower() for address in addresses]
+    with _info_db_lock:
+        stored = {}
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            rows = db.execute(
+                "SELECT address, info FROM contract_info WHERE chain_id = ? AND address IN "
+                f"({','.join('?' * len(chunk))})",
+                [chain_id, *chunk]
+            )
+            stored.update((address, json.loads(info)) for address, info in rows)
+
+    missing = [address for address, key in zip(addresses, keys) if key not in stored]
+    if missing:
+        fetched = connector.find_contracts(missing)
+        new_rows = []
+        for address, info in zip(missing, fetched):
+            if info is None:
+                continue
+            stored[address.lower()] = info
+            if _is_initialized(info):
+                new_rows.append((chain_id, address.lower(), json.dumps(info)))
+        if new_rows:
+            with _info_db_lock:
+                db.executemany("INSERT OR REPLACE INTO contract_info VALUES (?, ?, ?)", new_rows)
+
+    return [stored.get(key) for key in keys]
+
+
+# Rows of the pairwise distance matrix computed at once in create_semid_knowledge_graph
+GRAPH_BLOCK_ROWS = 1024
+
+
+# One embedding at a time: the HF tokenizer is not safe for concurrent use, and torch
+# already spreads a single forward pass over every core
+_semid_lock = threading.Lock()
+
+
+def _locked_semid_call(method: str, *args):
+    """Call a SemID method by name (loading the model first if needed)"""
+    semid = _semid()
+    with _semid_lock:
+        return getattr(semid, method)(*args)
+
+
+async def _run_semid(method: str, *args):
+    """Run a blocking SemID call in a worker thread so the event loop keeps serving other tools"""
+    return await asyncio.to_thread(_locked_semid_call, method, *args)
+
+
+def _in_thread(fn):
+    """Expose a blocking tool as a coroutine that runs in a worker thread"""
+    @wraps(fn)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(fn, *args, **kwargs)
+    return wrapper
+
+
+# Successful blockchain_status responses are reused for this long, so an agent polling
+# within a burst gets an answer without another RPC (0 disables)
+RESPONSE_CACHE_TTL = float(os.getenv("SEMID_RESPONSE_CACHE_TTL", "0.2"))  # seconds
+
+
+def _ttl_response_cache(maxsize: int):
+    """Reuse a tool's successful responses for RESPONSE_CACHE_TTL seconds, keyed on its arguments"""
+    def decorator(fn):
+        entries: "OrderedDict[Any, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        lock = threading.Lock()
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if RESPONSE_CACHE_TTL <= 0:
+                return fn(*args, **kwargs)
+
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            with lock:
+                entry = entries.get(key)
+                if entry is not None and now - entry[0] < RESPONSE_CACHE_TTL:
+                    return dict(entry[1])
+
+            response = fn(*args, **kwargs)
+            if "error" not in response:
+                with lock:
+                    entries[key] = (now, response)
+                    entries.move_to_end(key)
+                    if len(entries) > maxsize:
+                        entries.popitem(last=False)
+            return dict(response)
+        return wrapper
+    return decorator
+
+
+def _semid_distance(a: int, b: int) -> int:
+    """Hamming distance between two 24-bit SemIDs"""
+    return (a ^ b).bit_count()
+
+
+def _bit_flip_masks(max_distance: int):
+    """Yield (distance, mask) for every 24-bit mask with popcount <= max_distance, nearest first"""
+    for distance in range(max_distance + 1):
+        for bits in itertools.combinations(range(24), distance):
+            mask = 0
+            for b in bits:
+                mask |= 1 << b
+            yield distance, mask
+
+
+def _hex_to_bytes(data: str) -> bytes:
+    """Decode hex with or without a 0x prefix (raises ValueError on malformed input)"""
+    try:
+        return binascii.a2b_hex(data[2:] if data[:2] in ("0x", "0X") else data)
+    except binascii.Error as e:
+        raise ValueError(f"Invalid hex data: {e}")
+
+
+# ===== SemID Tools =====
+
+@mcp.tool()
+async def calc_semid(text: str) -> str:
+    """
+    Generate a 24-bit SemID from text as a hex string.
+
+    Args:
+        text: Input text
+
+    Returns:
+        6-character hex SemID
+    """
+    return f"{await _run_semid('id24', text):06x}"
+
+
+@mcp.tool()
+async def calc_semid_int(text: str) -> int:
+    """
+    Generate a 24-bit SemID from text as an integer.
+
+    Args:
+        text: Input text
+
+    Returns:
+        SemID in the range 0..2^24-1
+    """
+    return await _run_semid("id24", text)
+
+
+@mcp.tool()
+async def calc_semid_bytes(text: str) -> str:
+    """
+    Generate a 24-bit SemID from text as hex-encoded bytes.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Hex encoding of the 3-byte big-endian SemID
+    """
+    return f"{await _run_semid('id24', text):06x}"
+
+
+@mcp.tool()
+async def calc_semid_batch(texts: List[str]) -> List[int]:
+    """
+    Generate 24-bit SemIDs for many texts in one call (identical to calc_semid_int per text).
+
+    Args:
+        texts: Input texts
+
+    Returns:
+        SemIDs (integers in the range 0..2^24-1), in the same order as texts
+    """
+    return await _run_semid("id24_batch", texts)
+
+
+@mcp.tool()
+async def compare_semid_texts(text1: str, text2: str) -> Dict[str, Any]:
+    """
+    Compare the SemIDs of two texts.
+
+    Args:
+        text1: First text
+        text2: Second text
+
+    Returns:
+        Dictionary with both SemIDs, their Hamming distance and similarity (1 - distance / 24)
+    """
+    # Both texts go through a single embedding batch
+    semid1, semid2 = await _run_semid("id24_batch", [text1, text2])
+    distance = _semid_distance(semid1, semid2)
+
+    return {
+        "text1": text1,
+        "text2": text2,
+        "semid1": semid1,
+        "semid2": semid2,
+        "semid1_hex": f"{semid1:06x}",
+        "semid2_hex": f"{semid2:06x}",
+        "hamming_distance": distance,
+        "similarity": 1 - distance / 24,
+        "same_semid": semid1 == semid2
+    }
+
+
+@mcp.tool()
+async def create_semid_knowledge_graph(texts: List[str], similarity_threshold: float = 0.8) -> Dict[str, Any]:
+    """
+    Build a knowledge graph linking texts whose SemIDs are similar.
+
+    Args:
+        texts: Texts to use as graph nodes
+        similarity_threshold: Minimum SemID similarity (1 - distance / 24) for a link
+
+    Returns:
+        Dictionary with nodes, links (by node index) and their counts
+    """
+    # Every SemID is computed once, in one embedding batch
+    semids = await _run_semid("id24_batch", texts)
+
+    nodes = [
+        {
+            "id": i,
+            "text": text,
+            "semid": semid,
+            "semid_hex": f"{semid:06x}"
+        }
+        for i, (text, semid) in enumerate(zip(texts, semids))
+    ]
+
+    # Pairwise distances are XOR + popcount over blocks of rows, so memory stays O(block * N)
+    ids = np.asarray(semids, dtype=np.uint32)
+    max_distance = np.floor(24 * (1 - similarity_threshold) + 1e-9)
+    links = []
+    for start in range(0, len(ids), GRAPH_BLOCK_ROWS):
+        block = ids[start:start + GRAPH_BLOCK_ROWS]
+        distances = np.bitwise_count(block[:, None] ^ ids[None, :])
+        rows, cols = np.nonzero(distances <= max_distance)
+        upper = cols > rows + start
+        for i, j in zip((rows[upper] + start).tolist(), cols[upper].tolist()):
+            distance = int(distances[i - start, j])
+            similarity = 1 - distance / 24
+            if similarity >= similarity_threshold:
+                links.append({
+                    "source": i,
+                    "target": j,
+                    "hamming_distance": distance,
+                    "similarity": similarity
+                })
+
+    return {
+        "nodes": nodes,
+        "links": links,
+        "total_nodes": len(nodes),
+        "total_links": len(links),
+        "similarity_threshold": similarity_threshold
+    }
 
 
 # ===== Blockchain Integration Tools =====
+# web3 is synchronous, so these tools run in worker threads (@_in_thread) to keep the event loop free
 
 @mcp.tool()
+@_in_thread
+@_ttl_response_cache(maxsize=1)
 def blockchain_status() -> Dict[str, Any]:
     """
     Get the current blockchain connection status and configuration.
@@ -62,20 +427,23 @@ def blockchain_status() -> Dict[str, Any]:
     try:
         connector = get_blockchain_connector()
 
+        # one batched round-trip per call: the latest block number is the liveness check, the chain id is
+        # cached per connector and the balance for a couple of seconds
+        chain_id, balance_wei, block_number = connector.get_chain_state()
+
         status = {
-            "connected": connector.w3.is_connected(),
-            "chain_id": connector.w3.eth.chain_id,
+            "connected": block_number is not None,
+            "chain_id": chain_id,
+            "block_number": block_number,
             "factory_configured": connector.factory_address is not None,
             "account_configured": connector.account is not None,
         }
 
         if connector.account:
-            balance = connector.w3.from_wei(
-                connector.w3.eth.get_balance(connector.account.address), 'ether'
-            )
+            # int / int is a correctly rounded float, so from_wei's Decimal round-trip is not needed
             status.update({
                 "account_address": connector.account.address,
-                "account_balance": float(balance),
+                "account_balance": balance_wei / 10**18,
             })
 
         if connector.factory_address:
@@ -91,6 +459,7 @@ def blockchain_status() -> Dict[str, Any]:
 
 
 @mcp.tool()
+@_in_thread
 def predict_contract_address(text: str) -> Dict[str, Any]:
     """
     Predict the contract address that would be deployed for the given text using SemID.
@@ -104,18 +473,15 @@ def predict_contract_address(text: str) -> Dict[str, Any]:
     try:
         connector = get_blockchain_connector()
 
-        # Generate SemID and convert to 32-byte salt
-        semid_value = semid_instance.id24(text)
-        salt = semid_value.to_bytes(32, 'big')
-
-        predicted_address = connector.compute_address(salt)
+        semid_value, semid_hex, salt_hex, predicted_address = _predict_static(text)
+        # Deployment state is the only part that is not cached forever (see CODE_CHECK_TTL)
         is_deployed = connector.is_contract_deployed(predicted_address)
 
         return {
             "text": text,
             "semid": semid_value,
-            "semid_hex": semid_instance.id_hex(text),
-            "salt": salt.hex(),
+            "semid_hex": semid_hex,
+            "salt": salt_hex,
             "predicted_address": predicted_address,
             "is_deployed": is_deployed
         }
@@ -125,6 +491,7 @@ def predict_contract_address(text: str) -> Dict[str, Any]:
 
 
 @mcp.tool()
+@_in_thread
 def knowlege_mining(
     text: str,
     data: Optional[str] = "",
@@ -145,14 +512,20 @@ def knowlege_mining(
     Returns:
         Dictionary containing deployment result information
     """
+    # Reject malformed hex before touching the model or the chain
     try:
-        deployer_instance = get_deployer()
+        data_bytes = _hex_to_bytes(data) if data else b""
+    except ValueError as e:
+        return {"error": str(e)}
 
-        # Convert hex data to bytes if provided
-        data_bytes = bytes.fromhex(data) if data else b""
+    try:
+        deployer_instance = get_deployer()
 
-        result = deployer_instance.deploy_from_text(
+        semid_value, _, salt = _semid_bundle(text)
+        result = deployer_instance.deploy_from_semid(
             text=text,
+            semid_value=semid_value,
+            salt=salt,
             data=data_bytes,
             decode_info=decode_info,
             arbitrary_info=arbitrary_info,
@@ -165,8 +538,133 @@ def knowlege_mining(
         return {"error": str(e)}
 
 
+@mcp.tool()
+@_in_thread
+def batch_deploy_from_texts(
+    texts: List[str],
+    base_data: Optional[str] = "",
+    base_decode_info: Optional[str] = "",
+    gas_limit: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Deploy a KnowledgeContract for each text, using the same data for all of them.
+
+    Args:
+        texts: Input texts to generate SemIDs for deployment
+        base_data: Hex-encoded binary data stored in every contract (optional)
+        base_decode_info: String describing how to decode the data (optional)
+        gas_limit: Gas limit for each deployment transaction (optional)
+
+    Returns:
+        Dictionary with per-text results and deployment counts
+    """
+    try:
+        data_bytes = _hex_to_bytes(base_data) if base_data else b""
+    except Exception as e:
+        return {"error": str(e)}
+
+    return _deploy_texts(texts, [data_bytes] * len(texts), base_decode_info, gas_limit)
+
+
+@mcp.tool()
+@_in_thread
+def knowlege_mining_batch(
+    texts: List[str],
+    data_list: Optional[List[str]] = None,
+    decode_info: Optional[str] = "",
+    gas_limit: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Deploy a KnowledgeContract for each text, each with its own data.
+
+    All transactions are broadcast back to back with consecutive nonces and
+    mined together, instead of waiting one block per text.
+
+    Args:
+        texts: Input texts to generate SemIDs for deployment
+        data_list: Hex-encoded binary data for each text (optional, same length as texts)
+        decode_info: String describing how to decode the data (optional)
+        gas_limit: Gas limit for each deployment transaction (optional)
+
+    Returns:
+        Dictionary with per-text results and deployment counts
+    """
+    try:
+        if data_list is not None and len(data_list) != len(texts):
+            raise ValueError("data_list must have one entry per text")
+        data_bytes = [_hex_to_bytes(data) if data else b"" for data in (data_list or [""] * len(texts))]
+    except Exception as e:
+        return {"error": str(e)}
+
+    return _deploy_texts(texts, data_bytes, decode_info, gas_limit)
+
+
+@mcp.tool()
+@_in_thread
+def knowlege_mining_bulk(entries: List[Dict[str, str]], gas_limit: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Deploy many KnowledgeContracts with a few multi-create factory transactions.
+
+    Up to BULK_DEPLOY_SIZE contracts share one deployAndInitializeBatch call,
+    so N entries cost about N / BULK_DEPLOY_SIZE transactions and one block wait.
+    Requires a Create2Factory build with deployAndInitializeBatch.
+
+    Args:
+        entries: Objects with "text" and optional "data" (hex), "decode_info" and "arbitrary_info"
+        gas_limit: Gas limit per contract (optional)
+
+    Returns:
+        Dictionary with per-entry results and deployment counts
+    """
+    try:
+        texts = [entry["text"] for entry in entries]
+        data_list = [_hex_to_bytes(entry["data"]) if entry.get("data") else b"" for entry in entries]
+    except (KeyError, ValueError) as e:
+        return {"error": f"Invalid entry: {e}"}
+
+    from blockchain_integration import BULK_DEPLOY_SIZE
+    return _deploy_texts(
+        texts,
+        data_list,
+        "",
+        gas_limit,
+        decode_info_list=[entry.get("decode_info") or "" for entry in entries],
+        arbitrary_info_list=[entry.get("arbitrary_info") or "" for entry in entries],
+        batch_size=BULK_DEPLOY_SIZE
+    )
+
+
+def _deploy_texts(texts: List[str], data_list: List[bytes], decode_info: str, gas_limit: Optional[int], **options) -> Dict[str, Any]:
+    """Deploy contracts for texts through the pipelined deployer and summarize the results"""
+    try:
+        deployer_instance = get_deployer()
+
+        # All SemIDs come from one embedding batch instead of one encode per text
+        semids = _locked_semid_call("id24_batch", texts)
+        results = deployer_instance.deploy_many_from_semids(
+            texts,
+            semids,
+            data_list=data_list,
+            decode_info=decode_info,
+            gas_limit=gas_limit,
+            **options
+        )
+    except Exception as e:
+        return {"error": str(e)}
+
+    failed = sum(1 for r in results if "error" in r)
+    already_deployed = sum(1 for r in results if r.get("already_deployed"))
+    return {
+        "total": len(texts),
+        "deployed": len(texts) - failed - already_deployed,
+        "already_deployed": already_deployed,
+        "failed": failed,
+        "results": results
+    }
+
 
 @mcp.tool()
+@_in_thread
 def find_contract_by_text(text: str) -> Dict[str, Any]:
     """
     Find an existing KnowledgeContract deployed with the SemID of the given text.
@@ -180,20 +678,16 @@ def find_contract_by_text(text: str) -> Dict[str, Any]:
     try:
         connector = get_blockchain_connector()
 
-        # Generate SemID and predict address
-        semid_value = semid_instance.id24(text)
-        salt = semid_value.to_bytes(32, 'big')
-        predicted_address = connector.compute_address(salt)
+        semid_value, semid_hex, _, predicted_address = _predict_static(text)
 
-        # Check if contract exists
-        if connector.is_contract_deployed(predicted_address):
-            # Get contract info
-            contract_info = connector.get_contract_info(predicted_address)
+        # Check if contract exists (initialized contracts come from the local store)
+        contract_info = _find_contracts_cached(connector, [predicted_address])[0]
+        if contract_info is not None:
             return {
                 "found": True,
                 "text": text,
                 "semid": semid_value,
-                "semid_hex": semid_instance.id_hex(text),
+                "semid_hex": semid_hex,
                 "contract_address": predicted_address,
                 "contract_info": contract_info
             }
@@ -202,7 +696,7 @@ def find_contract_by_text(text: str) -> Dict[str, Any]:
                 "found": False,
                 "text": text,
                 "semid": semid_value,
-                "semid_hex": semid_instance.id_hex(text),
+                "semid_hex": semid_hex,
                 "predicted_address": predicted_address,
                 "message": "Contract not found. Use deploy_contract_from_text to deploy it."
             }
@@ -211,6 +705,109 @@ def find_contract_by_text(text: str) -> Dict[str, Any]:
         return {"error": str(e)}
 
 
+@mcp.tool()
+@_in_thread
+def find_contracts_by_texts(texts: List[str]) -> Dict[str, Any]:
+    """
+    Find the KnowledgeContracts deployed with the SemIDs of several texts.
+
+    All lookups are aggregated through Multicall3, so the whole list costs
+    one embedding batch and a single eth_call (per 200 texts).
+
+    Args:
+        texts: Input texts to find contracts for
+
+    Returns:
+        Dictionary with per-text results (contract info if found, predicted address otherwise)
+    """
+    try:
+        connector = get_blockchain_connector()
+
+        semids = _locked_semid_call("id24_batch", texts)
+        addresses = [_compute_addr(semid_value) for semid_value in semids]
+        infos = _find_contracts_cached(connector, addresses)
+
+        results = []
+        for text, semid_value, address, info in zip(texts, semids, addresses, infos):
+            result = {
+                "found": info is not None,
+                "text": text,
+                "semid": semid_value,
+                "semid_hex": f"{semid_value:06x}",
+            }
+            if info is not None:
+                result["contract_address"] = address
+                result["contract_info"] = info
+            else:
+                result["predicted_address"] = address
+            results.append(result)
+
+        return {
+            "total": len(texts),
+            "found": sum(1 for r in results if r["found"]),
+            "results": results
+        }
+
+    except Exception as e:
+        return {"error": str(e)}
+
+
+@mcp.tool()
+@_in_thread
+def find_similar_contracts(text: str, max_distance: int = 3, sample_size: int = 1000) -> Dict[str, Any]:
+    """
+    Find deployed KnowledgeContracts whose SemID is within a Hamming distance of the text's SemID.
+
+    Candidates are enumerated exactly, nearest first, by flipping up to
+    max_distance of the 24 SemID bits (2325 candidates for distance 3).
+
+    Args:
+        text: Input text to search around
+        max_distance: Maximum Hamming distance between SemIDs (0-24)
+        sample_size: Maximum number of candidate SemIDs to check
+
+    Returns:
+        Dictionary containing the matching contracts ordered by distance
+    """
+    try:
+        connector = get_blockchain_connector()
+
+        base_semid, base_hex, _ = _semid_bundle(text)
+        max_distance = max(0, min(max_distance, 24))
+
+        candidates = [
+            (distance, base_semid ^ mask)
+            for distance, mask in itertools.islice(_bit_flip_masks(max_distance), sample_size)
+        ]
+        addresses = [_compute_addr(candidate) for _, candidate in candidates]
+
+        # All eth_getCode lookups go out as JSON-RPC batches instead of one round-trip each
+        deployed_flags = connector.are_contracts_deployed(addresses)
+
+        contracts = []
+        for (distance, candidate), address, deployed in zip(candidates, addresses, deployed_flags):
+            if deployed:
+                contracts.append({
+                    "semid": candidate,
+                    "semid_hex": f"{candidate:06x}",
+                    "hamming_distance": distance,
+                    "contract_address": address
+                })
+
+        return {
+            "text": text,
+            "semid": base_semid,
+            "semid_hex": base_hex,
+            "max_distance": max_distance,
+            "candidates_checked": len(candidates),
+            "total_candidates": sum(math.comb(24, k) for k in range(max_distance + 1)),
+            "found": len(contracts),
+            "contracts": contracts
+        }
+
+    except Exception as e:
+        return {"error": str(e)}
+
 
 if __name__ == "__main__":
     # Initialize and run the server
@@ -25,7 +25,7 @@ def test_semid_generation():
 
     for text in test_texts:
         semid_val = semid.id24(text)
-        semid_hex = semid.id_hex(text)
+        semid_hex = f"{semid_val:06x}"
         print(f"Text: '{text}'")
         print(f"SemID: {semid_val} (0x{semid_hex})")
         print(f"Salt (32 bytes): 0x{semid_val.to_bytes(32, 'big').hex()}")
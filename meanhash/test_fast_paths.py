@@ -0,0 +1,271 @@
+"""
+pytest checks that the optimized SemID / clustering paths agree with the plain reference algorithms.
+
+Run: python -m pytest -q test_fast_paths.py
+"""
+
+import hashlib
+import random
+import sys
+import types
+
+import numpy as np
+import pytest
+
+try:
+    import sentence_transformers  # noqa: F401
+except ImportError:
+    # Every test swaps in a stub model, so the real package only has to be importable
+    sys.modules["sentence_transformers"] = types.ModuleType("sentence_transformers")
+    sys.modules["sentence_transformers"].SentenceTransformer = None
+
+import gold
+from convert import ApproximateBitstring, hamming_distance
+
+
+# ===== Reference implementations (straight ports of the original loops) =====
+
+def _ref_codebook24():
+    """Codebook built message by message via polynomial division, as the original Golay24 did."""
+    g = (1 << 11) | (1 << 9) | (1 << 7) | (1 << 6) | (1 << 5) | (1 << 1) | 1
+    code = []
+    for m in range(1 << 12):
+        r = m << 11
+        while r and r.bit_length() >= g.bit_length():
+            r ^= g << (r.bit_length() - g.bit_length())
+        cw23 = (m << 11) ^ r
+        code.append(cw23 | ((cw23.bit_count() & 1) << 23))
+    return code
+
+
+REF_CODEBOOK = _ref_codebook24()
+
+
+def _ref_decode(v: int) -> int:
+    """Nearest codeword by brute force; ties go to the smallest message."""
+    return min(range(len(REF_CODEBOOK)), key=lambda m: ((REF_CODEBOOK[m] ^ v).bit_count(), m))
+
+
+def _ref_id24(seed_base: str, t: str, x: np.ndarray) -> int:
+    parts = []
+    for i in range(gold.L):
+        rng = np.random.RandomState(gold._hash32(f"{seed_base}::head{i}::W"))
+        W = rng.normal(size=(x.shape[0], gold.N)).astype(np.float32)
+        W /= (np.linalg.norm(W, axis=0, keepdims=True) + 1e-12)
+        u = x @ W
+        v = 0
+        for j in range(gold.N):
+            if abs(u[j]) < gold.EPS:
+                bit = hashlib.sha256(f"tb:v1|{t}|{i}|{j}".encode("utf-8")).digest()[0] & 1
+            else:
+                bit = int(u[j] >= 0)
+            v |= bit << j
+        parts.append(_ref_decode(v))
+    return (parts[0] << 12) | parts[1]
+
+
+class _ReferenceClusters:
+    """List-based model of ApproximateBitstring: MRU first, then lowest row, LRU row reused when full."""
+
+    def __init__(self, maxlen: int):
+        self.maxlen = maxlen
+        self.rows = []  # [representative, label, last_used]
+        self.clock = 0
+        self.mru = None
+
+    def approximate_bitstring(self, bitstring: str, n: int) -> str:
+        self.clock += 1
+        row = self.mru
+        if row is None or hamming_distance(self.rows[row][0], bitstring) > n:
+            row = next((r for r, (rep, _, _) in enumerate(self.rows) if hamming_distance(rep, bitstring) <= n), None)
+        if row is None:
+            if len(self.rows) < self.maxlen:
+                self.rows.append(None)
+                row = len(self.rows) - 1
+            else:
+                row = min(range(len(self.rows)), key=lambda r: self.rows[r][2])
+            self.rows[row] = [bitstring, bitstring, 0]
+        self.rows[row][2] = self.clock
+        self.mru = row
+        return self.rows[row][1]
+
+
+# ===== Golay24 =====
+
+@pytest.fixture(scope="module")
+def golay():
+    return gold.Golay24()
+
+
+def _random_words(count: int, seed: int = 0) -> list:
+    rnd = random.Random(seed)
+    words = []
+    for _ in range(count):
+        # Half uniform (many at distance 4), half a codeword with 0..4 flipped bits
+        if rnd.random() < 0.5:
+            words.append(rnd.getrandbits(24))
+        else:
+            v = REF_CODEBOOK[rnd.randrange(4096)]
+            for p in rnd.sample(range(24), rnd.randint(0, 4)):
+                v ^= 1 << p
+            words.append(v)
+    return words
+
+
+def test_codebook_matches_reference(golay):
+    assert golay._codebook24 == REF_CODEBOOK
+
+
+def test_syndrome_decode_matches_brute_force(golay):
+    words = _random_words(400)
+    expected = [_ref_decode(v) for v in words]
+
+    msgs, ok = golay._syndrome_decode(np.array(words, dtype=np.uint32))
+    for v, m, sure, e in zip(words, msgs.tolist(), ok.tolist(), expected):
+        # Words flagged as settled must already carry the nearest codeword
+        if sure:
+            assert m == e, hex(v)
+        assert sure == (min((cw ^ v).bit_count() for cw in REF_CODEBOOK) <= 3)
+
+    bits = [np.array([(v >> j) & 1 for j in range(24)], dtype=np.uint8) for v in words]
+    assert [golay.decode_to_msg12(b) for b in bits] == expected
+    assert golay.decode_words_to_msg12(np.array(words), chunk=7).tolist() == expected
+
+
+# ===== SemID =====
+
+DIM = 32
+
+
+class _StubModel:
+    """Deterministic stand-in for SentenceTransformer: text -> fixed unit vector."""
+
+    def __init__(self, *args, **kwargs):
+        self.vectors = {}
+
+    def vector(self, t: str) -> np.ndarray:
+        if t not in self.vectors:
+            rng = np.random.RandomState(gold._hash32(t))
+            x = rng.normal(size=DIM)
+            self.vectors[t] = x / np.linalg.norm(x)
+        return self.vectors[t]
+
+    def encode(self, texts, batch_size=32, normalize_embeddings=False):
+        return np.array([self.vector(t) for t in texts], dtype=np.float32)
+
+
+@pytest.fixture
+def semid(monkeypatch, tmp_path):
+    monkeypatch.setattr(gold, "SentenceTransformer", _StubModel)
+    monkeypatch.setattr(gold, "W_CACHE_DIR", str(tmp_path))
+    return gold.SemID()
+
+
+def _tie_embedding(seed_base: str, cols) -> np.ndarray:
+    """Unit vector orthogonal to the given W columns, so those bits go through the tie-break hash."""
+    heads = []
+    for i in range(gold.L):
+        rng = np.random.RandomState(gold._hash32(f"{seed_base}::head{i}::W"))
+        W = rng.normal(size=(DIM, gold.N)).astype(np.float32)
+        heads.append(W / (np.linalg.norm(W, axis=0, keepdims=True) + 1e-12))
+    A = np.stack([heads[i][:, j] for i, j in cols], axis=1).astype(np.float64)
+    x = np.random.RandomState(7).normal(size=DIM)
+    x -= A @ np.linalg.lstsq(A, x, rcond=None)[0]
+    return x / np.linalg.norm(x)
+
+
+def test_id24_matches_reference(semid):
+    rnd = random.Random(1)
+    texts = ["".join(rnd.choice("abcde fgh\t\n") for _ in range(rnd.randint(1, 30))) for _ in range(60)]
+    texts += [" Tie  case ", "tie case"]
+    semid.model.vectors["Tie case"] = _tie_embedding(semid.seed_base, [(0, 3), (0, 17), (1, 0)])
+    semid.model.vectors["tie case"] = _tie_embedding(semid.seed_base, [(1, 5), (1, 23)])
+
+    expected = []
+    for s in texts:
+        t = gold.text_norm(s)
+        expected.append(_ref_id24(semid.seed_base, t, semid.model.vector(t).astype(np.float32)))
+
+    assert [semid.id24(s) for s in texts] == expected
+    assert semid.id24_batch(texts) == expected
+    assert semid.id24_batch([]) == []
+
+
+class _PaddingSensitiveModel(_StubModel):
+    """Multi-text encode calls drift slightly, like padded batches on a real model."""
+
+    def encode(self, texts, batch_size=32, normalize_embeddings=False):
+        xs = super().encode(texts, batch_size, normalize_embeddings)
+        if len(texts) > 1:
+            xs += np.random.RandomState(len(texts)).normal(scale=1e-3, size=xs.shape).astype(np.float32)
+        return xs
+
+
+def test_id24_batch_is_independent_of_batch_composition(monkeypatch, tmp_path):
+    monkeypatch.setattr(gold, "SentenceTransformer", _PaddingSensitiveModel)
+    monkeypatch.setattr(gold, "W_CACHE_DIR", str(tmp_path))
+    rnd = random.Random(2)
+    texts = ["".join(rnd.choice("abcdefgh ") for _ in range(rnd.randint(1, 30))) for _ in range(200)]
+
+    single = gold.SemID()
+    expected = [single.id24(s) for s in texts]
+    assert gold.SemID().id24_batch(texts) == expected
+    assert gold.SemID().id24_batch(texts[::-1]) == expected[::-1]
+
+
+def test_w_cache_roundtrip(semid):
+    ids = semid.id24_batch(["alpha", "beta", "gamma"])
+    reloaded = gold.SemID()
+    assert reloaded.id24_batch(["alpha", "beta", "gamma"]) == ids
+    assert isinstance(reloaded.W, np.memmap)
+
+
+# ===== ApproximateBitstring =====
+
+def _first_match_label(clusters: dict, bitstring: str, n: int) -> str:
+    """The original ApproximateBitstring: first representative (insertion order) within n."""
+    for rep, label in clusters.items():
+        if hamming_distance(bitstring, rep) <= n:
+            return label
+    clusters[bitstring] = bitstring
+    return bitstring
+
+
+@pytest.mark.parametrize("nbits,n", [(64, 2), (100, 3)])
+def test_approximate_bitstring_matches_first_match_without_eviction(nbits, n):
+    # The centres themselves become the representatives and are > 2n apart, so every input is
+    # within n of at most one of them and the MRU shortcut cannot pick a different cluster
+    rnd = random.Random(nbits)
+    centers = []
+    while len(centers) < 40:
+        c = rnd.getrandbits(nbits)
+        if all((c ^ o).bit_count() > 2 * n for o in centers):
+            centers.append(c)
+    fast = ApproximateBitstring(maxlen=len(centers))
+    clusters = {}
+    inputs = list(centers)
+    for _ in range(1000):
+        v = rnd.choice(centers)
+        for p in rnd.sample(range(nbits), rnd.randint(0, n)):
+            v ^= 1 << p
+        inputs.append(v)
+    for v in inputs:
+        s = format(v, f"0{nbits}b")
+        assert fast.approximate_bitstring(s, n) == _first_match_label(clusters, s, n)
+    assert sorted(fast.labels) == sorted(clusters)
+
+
+@pytest.mark.parametrize("nbits,maxlen,n", [(24, 8, 2), (40, 5, 3), (70, 16, 1), (12, 1, 2)])
+def test_approximate_bitstring_matches_reference(nbits, maxlen, n):
+    rnd = random.Random(nbits * 100 + maxlen)
+    centers = [rnd.getrandbits(nbits) for _ in range(3 * maxlen)]
+    fast = ApproximateBitstring(maxlen=maxlen)
+    ref = _ReferenceClusters(maxlen)
+    for _ in range(600):
+        # Bursts around a few centres exercise MRU hits; the spread forces evictions
+        v = rnd.choice(centers)
+        for p in rnd.sample(range(nbits), rnd.randint(0, n + 1)):
+            v ^= 1 << p
+        s = format(v, f"0{nbits}b")
+        assert fast.approximate_bitstring(s, n) == ref.approximate_bitstring(s, n)
+    assert len(fast.labels) == len(ref.rows) <= maxlen
@@ -3,6 +3,7 @@
 Test script for new MCP tools that enhance SemID-contract interaction
 """
 
+import asyncio
 import sys
 import os
 
@@ -10,13 +11,10 @@ import os
 sys.path.append('/Users/tanbajintaro/sentence_match/meanhash')
 
 from mcp_server import (
-    semid_instance,
     calc_semid,
     calc_semid_int,
+    calc_semid_batch,
     compare_semid_texts,
-    blockchain_status,
-    predict_contract_address,
-    find_contract_by_text,
     create_semid_knowledge_graph
 )
 
@@ -27,17 +25,17 @@ def test_semid_tools():
     test_text = "This is a test for SemID generation."
 
     # Test calc_semid
-    hex_result = calc_semid(test_text)
+    hex_result = asyncio.run(calc_semid(test_text))
     print(f"calc_semid result: {hex_result}")
 
     # Test calc_semid_int
-    int_result = calc_semid_int(test_text)
+    int_result = asyncio.run(calc_semid_int(test_text))
     print(f"calc_semid_int result: {int_result}")
 
     # Test compare_semid_texts
     text1 = "Hello world"
     text2 = "Hello universe"
-    compare_result = compare_semid_texts(text1, text2)
+    compare_result = asyncio.run(compare_semid_texts(text1, text2))
     print(f"compare_semid_texts result: {compare_result}")
 
 def test_blockchain_tools():
@@ -45,17 +43,20 @@ def test_blockchain_tools():
     print("\n=== Testing Blockchain Tools ===")
 
     try:
+        # Only this test needs the blockchain tools (web3 is loaded on their first call)
+        from mcp_server import blockchain_status, predict_contract_address, find_contract_by_text
+
         # Test blockchain_status
-        status_result = blockchain_status()
+        status_result = asyncio.run(blockchain_status())
         print(f"blockchain_status result: {status_result}")
 
         # Test predict_contract_address
         test_text = "Sample knowledge base entry"
-        predict_result = predict_contract_address(test_text)
+        predict_result = asyncio.run(predict_contract_address(test_text))
         print(f"predict_contract_address result: {predict_result}")
 
         # Test find_contract_by_text
-        find_result = find_contract_by_text(test_text)
+        find_result = asyncio.run(find_contract_by_text(test_text))
         print(f"find_contract_by_text result: {find_result}")
 
     except Exception as e:
@@ -74,7 +75,7 @@ def test_knowledge_graph():
     ]
 
     try:
-        graph_result = create_semid_knowledge_graph(test_texts, 0.7)
+        graph_result = asyncio.run(create_semid_knowledge_graph(test_texts, 0.7))
         print(f"Knowledge graph created with {graph_result['total_nodes']} nodes and {graph_result['total_links']} links")
 
         # Show some connections
@@ -100,10 +101,9 @@ def test_batch_operations():
     ]
 
     print(f"Processing {len(batch_texts)} texts:")
-    for i, text in enumerate(batch_texts):
-        semid = calc_semid_int(text)
-        hex_id = calc_semid(text)
-        print(f"  {i+1}. '{text}' -> SemID: {semid} (0x{hex_id})")
+    semids = asyncio.run(calc_semid_batch(batch_texts))
+    for i, (text, semid) in enumerate(zip(batch_texts, semids)):
+        print(f"  {i+1}. '{text}' -> SemID: {semid} (0x{semid:06x})")
 
 def main():
     """Main test function"""